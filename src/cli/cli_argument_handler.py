@@ -1,13 +1,45 @@
+import argparse
+from functools import cache
 import logging
+import sys
+from typing import NoReturn
 
-from src.cli.cli_argument_parser import CLIArgumentParser
+from src.cli.cli_argument_parser import CLIArgumentParser, detect_command
 from src.cli.cli_argument_validator import CLIArgumentValidator
 
+# (result key, namespace attribute, default) for arguments that may be absent from the parsed namespace.
+ARGS_TO_RESULT_KEYS = (
+    ("match_links", "match_links", None),
+    ("sports", "sports", None),
+    ("from_date", "from_date", None),
+    ("to_date", "to_date", None),
+    ("leagues", "leagues", None),
+    ("storage_format", "format", None),
+    ("file_path", "file_path", None),
+    ("max_pages", "max_pages", None),
+    ("proxies", "proxies", None),
+    ("browser_user_agent", "browser_user_agent", None),
+    ("browser_locale_timezone", "browser_locale_timezone", None),
+    ("browser_timezone_id", "browser_timezone_id", None),
+    ("target_bookmaker", "target_bookmaker", None),
+    ("scrape_odds_history", "scrape_odds_history", True),
+    ("preview_submarkets_only", "preview_submarkets_only", False),
+    ("change_sensitivity", "change_sensitivity", "normal"),
+)
+
+USAGE_HINT = "usage: OddsHarvester <scrape_upcoming|scrape_historic> [options]  (--help for details)"
+
+
+@cache
+def _shared_parser(command: str | None) -> argparse.ArgumentParser:
+    """Build the parser for `command` (every command when None) once per process."""
+    return CLIArgumentParser(argv=[command] if command else []).get_parser()
+
 
 class CLIArgumentHandler:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.parser = CLIArgumentParser().get_parser()
+        self.parser = _shared_parser(detect_command(sys.argv[1:]))
         self.validator = CLIArgumentValidator()
 
     def parse_and_validate_args(self) -> dict:
@@ -16,40 +48,25 @@ class CLIArgumentHandler:
 
         if not args.command:
             self.logger.error("No CLI args Command provided")
-            self.parser.print_help()
-            exit(1)
+            self._exit_with_usage()
 
         try:
             self.validator.validate_args(args)
         except ValueError as e:
             self.logger.error(f"CLI args validation failed: {e}")
             print(f"CLI args validation failed: {e}")
-            self.parser.print_help()
-            exit(1)
-
-        # Normalize 'now' to current date/season handling
-        from src.utils.date_utils import parse_flexible_date
-        from datetime import datetime
+            self._exit_with_usage()
 
+        namespace = vars(args)
         return {
             "command": args.command,
-            "match_links": getattr(args, "match_links", None),
-            "sports": getattr(args, "sports", None),
-            "from_date": getattr(args, "from_date", None),
-            "to_date": getattr(args, "to_date", None),
-            "leagues": getattr(args, "leagues", None),
             "storage_type": args.storage,
-            "storage_format": getattr(args, "format", None),
-            "file_path": getattr(args, "file_path", None),
-            "max_pages": getattr(args, "max_pages", None),
-            "proxies": getattr(args, "proxies", None),
             "headless": args.headless,
             "markets": args.markets,
-            "browser_user_agent": getattr(args, "browser_user_agent", None),
-            "browser_locale_timezone": getattr(args, "browser_locale_timezone", None),
-            "browser_timezone_id": getattr(args, "browser_timezone_id", None),
-            "target_bookmaker": getattr(args, "target_bookmaker", None),
-            "scrape_odds_history": getattr(args, "scrape_odds_history", True),
-            "preview_submarkets_only": getattr(args, "preview_submarkets_only", False),
-            "change_sensitivity": getattr(args, "change_sensitivity", "normal") if hasattr(args, "change_sensitivity") and hasattr(getattr(args, "change_sensitivity", None), "__name__") else "normal",
+            **{key: namespace.get(attr, default) for key, attr, default in ARGS_TO_RESULT_KEYS},
         }
+
+    def _exit_with_usage(self) -> NoReturn:
+        """Exit with status 1 after logging a one-line usage hint."""
+        self.logger.error(USAGE_HINT)
+        raise SystemExit(1)
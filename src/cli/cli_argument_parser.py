@@ -1,42 +1,112 @@
 import argparse
+from functools import cache
+import sys
 
-from src.cli.cli_help_message_generator import CLIHelpMessageGenerator
-from src.storage.storage_format import StorageFormat
-from src.storage.storage_type import StorageType
-from src.utils.odds_format_enum import OddsFormat
-from src.utils.sport_market_constants import Sport
+COMMANDS = ("scrape_upcoming", "scrape_historic")
+HELP_FLAGS = ("-h", "--help")
+
+
+def split_csv(value: str) -> list[str]:
+    """Split a comma-separated argument into its items, stripping whitespace around each one."""
+    return list(map(str.strip, value.split(",")))
+
+
+@cache
+def _help_epilog() -> str:
+    """Build the help epilog once per process."""
+    from src.cli.cli_help_message_generator import CLIHelpMessageGenerator
+
+    return CLIHelpMessageGenerator().generate()
+
+
+@cache
+def _argument_choices() -> dict[str, tuple[str, ...]]:
+    """Return the enum-backed `choices` for common arguments, computed once per process."""
+    from src.storage.storage_format import StorageFormat
+    from src.storage.storage_type import StorageType
+    from src.utils.odds_format_enum import OddsFormat
+    from src.utils.sport_market_constants import Sport
+
+    return {
+        "sports": ("all", *(sport.value for sport in Sport)),
+        "storage": tuple(f.value for f in StorageType),
+        "format": tuple(f.value for f in StorageFormat),
+        "odds_format": tuple(f.value for f in OddsFormat),
+    }
+
+
+@cache
+def _common_arguments_parent() -> argparse.ArgumentParser:
+    """Build the arguments shared by every command once, to be reused by subparsers through `parents=`."""
+    parent = argparse.ArgumentParser(add_help=False)
+    CLIArgumentParser._add_common_arguments(parent)
+    return parent
+
+
+def detect_command(argv: list[str]) -> str | None:
+    """
+    Return the command requested in argv, or None when both subparsers are needed.
+
+    Both subparsers are required when help is requested or when no known command is present,
+    so that `print_help()` and argparse's own error reporting keep listing every command.
+    """
+    command = None
+    for token in argv:
+        if token in HELP_FLAGS:
+            return None
+        if command is None and token in COMMANDS:
+            command = token
+    return command
+
+
+class _LazyEpilogArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that only generates the help epilog when help is actually rendered."""
+
+    def format_help(self) -> str:
+        if self.epilog is None:
+            self.epilog = _help_epilog()
+        return super().format_help()
 
 
 class CLIArgumentParser:
     """Handles parsing of command-line arguments."""
 
-    def __init__(self):
-        """Initialize the argument parser."""
-        self.parser = argparse.ArgumentParser(
+    def __init__(self, argv: list[str] | None = None):
+        """
+        Initialize the argument parser.
+
+        Args:
+            argv: Arguments used to decide which subparsers to build (defaults to `sys.argv[1:]`).
+        """
+        self.parser = _LazyEpilogArgumentParser(
             description="OddsHarvester CLI for scraping betting odds data.",
-            epilog=CLIHelpMessageGenerator().generate(),
             formatter_class=argparse.RawTextHelpFormatter,
         )
-        self._initialize_subparsers()
+        self._initialize_subparsers(sys.argv[1:] if argv is None else argv)
 
     def parse_args(self, args=None):
         """Parse command line arguments."""
         return self.parser.parse_args(args)
 
-    def _initialize_subparsers(self):
-        """Add subparsers for different commands."""
+    def _initialize_subparsers(self, argv: list[str]):
+        """Add subparsers for different commands, building only the one requested in argv when possible."""
         subparsers = self.parser.add_subparsers(
             title="Commands",
             dest="command",
             help="Specify whether you want to scrape upcoming matches or historical odds.",
+            parser_class=argparse.ArgumentParser,
         )
 
-        self._add_upcoming_parser(subparsers)
-        self._add_historic_parser(subparsers)
+        command = detect_command(argv)
+        if command in (None, "scrape_upcoming"):
+            self._add_upcoming_parser(subparsers)
+        if command in (None, "scrape_historic"):
+            self._add_historic_parser(subparsers)
 
     def _add_upcoming_parser(self, subparsers):
-        parser = subparsers.add_parser("scrape_upcoming", help="Scrape odds for upcoming matches.")
-        self._add_common_arguments(parser)
+        parser = subparsers.add_parser(
+            "scrape_upcoming", parents=[_common_arguments_parent()], help="Scrape odds for upcoming matches."
+        )
         parser.add_argument(
             "--from", type=str, dest="from_date",
             help="Start date for upcoming matches (format: YYYYMMDD, YYYYMM, YYYY, or 'now')."
@@ -48,9 +118,10 @@ class CLIArgumentParser:
   
     def _add_historic_parser(self, subparsers):
         parser = subparsers.add_parser(
-            "scrape_historic", help="Scrape historical odds for a specific league and/or season."
+            "scrape_historic",
+            parents=[_common_arguments_parent()],
+            help="Scrape historical odds for a specific league and/or season.",
         )
-        self._add_common_arguments(parser)
         parser.add_argument(
             "--from", type=str, dest="from_date",
             help="� Start season/year for historical matches (format: YYYY, YYYY-YYYY, or 'now')."
@@ -61,7 +132,11 @@ class CLIArgumentParser:
         )
         parser.add_argument("--max_pages", type=int, help="� Maximum number of pages to scrape (optional).")
   
-    def _add_common_arguments(self, parser):
+    @staticmethod
+    def _add_common_arguments(parser):
+        from src.utils.odds_format_enum import OddsFormat
+
+        choices = _argument_choices()
         parser.add_argument(
             "--match_links",
             nargs="+",  # Allows multiple values
@@ -72,7 +147,7 @@ class CLIArgumentParser:
         parser.add_argument(
             "--sports",
             type=str,
-            choices=["all"] + [sport.value for sport in Sport],
+            choices=choices["sports"],
             help=(
                 "Specify the sport(s) to scrape. Use 'all' to scrape all 23 supported sports, or specify a sport "
                 "(e.g., football, tennis, basketball, rugby-league, rugby-union, ice-hockey, baseball, "
@@ -82,18 +157,18 @@ class CLIArgumentParser:
         )
         parser.add_argument(
             "--leagues",
-            type=lambda s: s.split(","),
+            type=split_csv,
             help="� Comma-separated list of leagues to scrape, or 'all' for all leagues (e.g., premier-league,champions-league).",
         )
         parser.add_argument(
             "--markets",
-            type=lambda s: s.split(","),
+            type=split_csv,
             help="📊 Comma-separated list of markets to scrape, 'all' for auto-discovery of all available markets, or leave empty for automatic market discovery (default: auto-discovery). Example: 1x2,btts or 'all'.",
         )
         parser.add_argument(
             "--storage",
             type=str,
-            choices=[f.value for f in StorageType],
+            choices=choices["storage"],
             default="local",
             help="� Storage type: local or remote (default: local).",
         )
@@ -101,7 +176,7 @@ class CLIArgumentParser:
         parser.add_argument(
             "--format",
             type=str,
-            choices=[f.value for f in StorageFormat],
+            choices=choices["format"],
             default="json",
             help="� Storage format (json or csv, default: json).",
         )
@@ -137,7 +212,7 @@ class CLIArgumentParser:
         parser.add_argument(
             "--odds_format",
             type=str,
-            choices=[f.value for f in OddsFormat],
+            choices=choices["odds_format"],
             default=OddsFormat.DECIMAL_ODDS.value,
             help="� Odds format to display (default: Decimal Odds).",
         )
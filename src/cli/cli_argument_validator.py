@@ -1,6 +1,7 @@
 import argparse
-from datetime import datetime
-import re
+from datetime import date, datetime
+from functools import cache
+import os
 
 from src.storage.storage_format import StorageFormat
 from src.storage.storage_type import StorageType
@@ -13,71 +14,113 @@ from src.utils.odds_format_enum import OddsFormat
 from src.utils.sport_market_constants import Sport
 from src.utils.utils import get_supported_markets
 
+# A match link is any non-empty path under one of these prefixes.
+MATCH_LINK_PREFIXES = ("https://www.oddsportal.com/", "http://www.oddsportal.com/")
+PROXY_SCHEMES = frozenset(("http", "https", "socks4", "socks5"))
+
+# Enum values and their joined listings for error messages, computed once at import.
+COMMAND_VALUES = frozenset(command.value for command in CommandEnum)
+SUPPORTED_COMMANDS = ", ".join(command.value for command in CommandEnum)
+SPORT_VALUES = frozenset(sport.value for sport in Sport)
+SUPPORTED_SPORTS = ", ".join(sport.value for sport in Sport)
+EXPECTED_SPORTS = f"Expected 'all' or one of {[sport.value for sport in Sport]}."
+STORAGE_TYPE_VALUES = frozenset(storage.value for storage in StorageType)
+SUPPORTED_STORAGE_TYPES = ", ".join(storage.value for storage in StorageType)
+STORAGE_FORMAT_VALUES = frozenset(storage_format.value for storage_format in StorageFormat)
+SUPPORTED_STORAGE_FORMATS = ", ".join(storage_format.value for storage_format in StorageFormat)
+ODDS_FORMAT_VALUES = frozenset(odds_format.value for odds_format in OddsFormat)
+SUPPORTED_ODDS_FORMATS = ", ".join(odds_format.value for odds_format in OddsFormat)
+
+# Argument -> name of the validator method taking only that argument's value, run when the argument is present.
+SINGLE_VALUE_VALIDATORS = (
+    ("proxies", "_validate_proxies"),
+    ("odds_format", "_validate_odds_format"),
+    ("concurrency_tasks", "_validate_concurrency_tasks"),
+)
+
+# Command -> name of the validator method for its --from/--to range.
+DATE_RANGE_VALIDATORS = {
+    "scrape_upcoming": "_validate_upcoming_date_range",
+    "scrape_historic": "_validate_historic_date_range",
+}
+
+
+@cache
+def _supported_markets(sport: Sport) -> tuple[frozenset[str], str]:
+    """Return the markets supported for a sport as a lookup set and as a joined listing, computed once per sport."""
+    markets = get_supported_markets(sport)
+    return frozenset(markets), ", ".join(markets)
+
+
+def _is_valid_proxy(proxy: str) -> bool:
+    """Check a proxy has the form `scheme://host:port` optionally followed by whitespace-separated `user pass`."""
+    scheme, separator, rest = proxy.partition("://")
+    if not separator or scheme not in PROXY_SCHEMES or rest != rest.strip():
+        return False
+
+    parts = rest.split()
+    if len(parts) not in (1, 3):
+        return False
+
+    host, separator, port = parts[0].rpartition(":")
+    host_chars = host.replace(".", "").replace("-", "").replace("_", "")
+    return bool(separator and host and port.isdecimal() and (not host_chars or host_chars.isalnum()))
+
 
 class CLIArgumentValidator:
     def validate_args(self, args: argparse.Namespace):
         """Validates parsed CLI arguments."""
         self._validate_command(command=args.command)
 
-        if isinstance(args.markets, str):
-            args.markets = [market.strip() for market in args.markets.split(",")]
-
-        if isinstance(args.leagues, str):
-            args.leagues = [league.strip() for league in args.leagues.split(",")]
-
+        values = vars(args)
         errors = []
 
         # Validate sports parameter
-        if hasattr(args, "sports"):
-            errors.extend(self._validate_sports(sports=args.sports))
+        sports = values.get("sports")
+        sport_errors = self._validate_sports(sports=sports) if "sports" in values else []
+        errors.extend(sport_errors)
 
-        # Determine actual sport(s) for other validations
-        sports = self._get_sports_from_args(args)
+        # Conditional validation: bypass sport/markets/leagues validation when --sports all is used,
+        # and don't repeat an invalid sport through the markets/leagues checks.
+        if sports != "all" and not sport_errors:
+            # Resolve the sport once for the checks that depend on it.
+            sport = Sport(sports.lower()) if sports else None
 
-        # Conditional validation: bypass sport/markets/leagues validation when --sports all is used
-        should_bypass_validation = sports == "all"
+            if "markets" in values:
+                errors.extend(self._validate_markets(sport=sport, markets=values["markets"]))
 
-        if not should_bypass_validation:
-            if hasattr(args, "markets"):
-                errors.extend(self._validate_markets(sport=sports, markets=args.markets))
-
-            if hasattr(args, "leagues"):
-                errors.extend(self._validate_leagues(sport=sports, leagues=args.leagues))
+            if "leagues" in values:
+                errors.extend(self._validate_leagues(sport=sport, leagues=values["leagues"]))
 
         # Match links validation should happen after bypass logic
-        if hasattr(args, "match_links"):
-            errors.extend(self._validate_match_links(match_links=args.match_links, sport=sports))
+        if "match_links" in values:
+            errors.extend(self._validate_match_links(match_links=values["match_links"], sport=sports))
 
-        if hasattr(args, "from_date") and hasattr(args, "to_date"):
+        if "from_date" in values and "to_date" in values:
             errors.extend(
                 self._validate_date_range(
                     command=args.command,
-                    from_date=args.from_date,
-                    to_date=args.to_date,
-                    match_links=args.match_links,
-                    leagues=getattr(args, "leagues", None),
+                    from_date=values["from_date"],
+                    to_date=values["to_date"],
+                    match_links=values.get("match_links"),
+                    leagues=values.get("leagues"),
                     sports=sports,
                 )
             )
 
-        if hasattr(args, "file_path") or hasattr(args, "format"):
+        if "file_path" in values or "format" in values:
             errors.extend(self._validate_file_args(args=args))
 
-        if hasattr(args, "max_pages"):
-            errors.extend(self._validate_max_pages(command=args.command, max_pages=args.max_pages))
-
-        if hasattr(args, "proxies"):
-            errors.extend(self._validate_proxies(args.proxies))
+        if "max_pages" in values:
+            errors.extend(self._validate_max_pages(command=args.command, max_pages=values["max_pages"]))
 
-        if hasattr(args, "target_bookmaker") and args.target_bookmaker and not isinstance(args.target_bookmaker, str):
+        target_bookmaker = values.get("target_bookmaker")
+        if target_bookmaker and not isinstance(target_bookmaker, str):
             errors.append("Target bookmaker must be a string if specified.")
 
-  
-        if hasattr(args, "odds_format"):
-            errors.extend(self._validate_odds_format(odds_format=args.odds_format))
-
-        if hasattr(args, "concurrency_tasks"):
-            errors.extend(self._validate_concurrency_tasks(concurrency_tasks=args.concurrency_tasks))
+        for name, validator_name in SINGLE_VALUE_VALIDATORS:
+            if name in values:
+                errors.extend(getattr(self, validator_name)(values[name]))
 
         errors.extend(
             self._validate_browser_settings(
@@ -91,90 +134,67 @@ class CLIArgumentValidator:
         if errors:
             raise ValueError("\n".join(errors))
 
-    def _validate_command(self, command: str | None):
+    @staticmethod
+    def _validate_command(command: str | None):
         """Validates the command argument."""
-        if command not in CommandEnum.__members__.values():
-            raise ValueError(
-                f"Invalid command '{command}'. Supported commands are: {', '.join(e.value for e in CommandEnum)}."
-            )
+        if command not in COMMAND_VALUES:
+            raise ValueError(f"Invalid command '{command}'. Supported commands are: {SUPPORTED_COMMANDS}.")
 
-    def _validate_match_links(self, match_links: list[str] | None, sport: str | None) -> list[str]:
+    @staticmethod
+    def _validate_match_links(match_links: list[str] | None, sport: str | None) -> list[str]:
         """Validates the format of match links."""
         errors = []
-        url_pattern = re.compile(r"https?://www\.oddsportal\.com/.+")
 
         if match_links:
             if not sport:
                 errors.append("The '--sports' argument is required when using '--match_links'.")
 
-            for link in match_links:
-                if not url_pattern.match(link):
-                    errors.append(f"Invalid match link format: {link}")
+            errors.extend(
+                f"Invalid match link format: {link}"
+                for link in match_links
+                if not link.startswith(MATCH_LINK_PREFIXES) or link in MATCH_LINK_PREFIXES
+            )
 
         return errors
 
-    def _validate_sports(self, sports: str | None) -> list[str]:
+    @staticmethod
+    def _validate_sports(sports: str | None) -> list[str]:
         """Validates the sports argument."""
-        errors = []
-        supported_sports = ", ".join(s.value for s in Sport)
-
         if not sports:
-            error_msg = f"Invalid sports: None. Expected 'all' or one of {[s.value for s in Sport]}."
-            errors.append(error_msg)
-            raise ValueError(error_msg)
+            return [f"Invalid sports: None. {EXPECTED_SPORTS}"]
 
-        if sports == "all":
-            return errors  # "all" is always valid
+        if sports == "all" or str(sports).lower() in SPORT_VALUES:
+            return []
 
-        try:
-            Sport(str(sports).lower())
-        except (ValueError, AttributeError):
-            if isinstance(sports, str):
-                error_msg = f"Invalid sport: '{sports}'. Supported sports are: {supported_sports}, or 'all' for all sports."
-            else:
-                error_msg = f"Invalid sport: {sports}. Expected 'all' or one of {[s.value for s in Sport]}."
-            errors.append(error_msg)
-            raise ValueError(error_msg) from None
-
-        return errors
-
-    def _get_sports_from_args(self, args: argparse.Namespace) -> str | None:
-        """Extracts the sports value from args for processing."""
-        if hasattr(args, "sports"):
-            return args.sports
-        return None
+        if isinstance(sports, str):
+            return [f"Invalid sport: '{sports}'. Supported sports are: {SUPPORTED_SPORTS}, or 'all' for all sports."]
+        return [f"Invalid sport: {sports}. {EXPECTED_SPORTS}"]
 
     def _validate_sport(self, sport: str | None) -> list[str]:
         """Validates the sport argument (kept for backward compatibility)."""
         return self._validate_sports(sport)
 
-    def _validate_markets(self, sport: str | Sport, markets: list[str]) -> list[str]:
+    @staticmethod
+    def _validate_markets(sport: Sport | None, markets: list[str]) -> list[str]:
         """Validates markets against the selected sport."""
         errors = []
 
-        # Skip market validation if sports is "all" or sport is None
-        if sport == "all" or sport is None:
+        # Skip market validation if no single sport is selected
+        if sport is None:
             return errors
 
-        if isinstance(sport, str):
-            try:
-                sport = Sport(sport.lower())
-            except ValueError:
-                return [f"Invalid sport: '{sport}'. Supported sports are: {', '.join(s.value for s in Sport)}."]
-
-        supported_markets = get_supported_markets(sport)
-
         if markets and "all" not in markets:
-            for market in markets:
-                if market not in supported_markets:
-                    errors.append(
-                        f"Invalid market: {market}. Supported markets for {sport.value}: "
-                        f"{', '.join(supported_markets)}."
-                    )
+            supported_markets, supported_markets_listing = _supported_markets(sport)
+            errors.extend(
+                f"Invalid market: {market}. Supported markets for {sport.value}: {supported_markets_listing}."
+                for market in markets
+                if market not in supported_markets
+            )
 
         return errors
 
-    def _validate_leagues(self, sport: str, leagues: list[str] | None) -> list[str]:
+    @staticmethod
+    def _validate_leagues(sport: Sport | None, leagues: list[str] | None) -> list[str]:
         """Validates the leagues argument based on the sport.
 
         Note: League validation is now handled dynamically during scraping.
@@ -182,18 +202,9 @@ class CLIArgumentValidator:
         """
         errors = []
 
-        if not leagues:
+        if not leagues or sport is None:
             return errors
 
-        # Skip league validation if sports is "all"
-        if sport == "all":
-            return errors
-
-        try:
-            Sport(sport.lower()) if isinstance(sport, str) else sport
-        except ValueError:
-            return [f"Invalid sport: '{sport}'. Supported sports are: {', '.join(s.value for s in Sport)}."]
-
         # League validation is now handled dynamically during scraping
         # No need to validate against hardcoded constants anymore
         return errors
@@ -208,17 +219,17 @@ class CLIArgumentValidator:
         if match_links or (leagues and sports != "all"):
             return errors
 
-        if command == "scrape_upcoming":
-            return self._validate_upcoming_date_range(from_date, to_date)
-        elif command == "scrape_historic":
-            return self._validate_historic_date_range(from_date, to_date)
-        else:
-            # Date ranges shouldn't be provided for other commands
-            if from_date or to_date:
-                errors.append(f"Date ranges should not be provided for the '{command}' command.")
-            return errors
+        validator_name = DATE_RANGE_VALIDATORS.get(command)
+        if validator_name is not None:
+            return getattr(self, validator_name)(from_date, to_date)
+
+        # Date ranges shouldn't be provided for other commands
+        if from_date or to_date:
+            errors.append(f"Date ranges should not be provided for the '{command}' command.")
+        return errors
 
-    def _validate_upcoming_date_range(self, from_date: str | None, to_date: str | None) -> list[str]:
+    @staticmethod
+    def _validate_upcoming_date_range(from_date: str | None, to_date: str | None) -> list[str]:
         """Validates date range for upcoming matches."""
         errors = []
 
@@ -253,7 +264,7 @@ class CLIArgumentValidator:
             return errors
 
         # Validate that start date is not too far in the past for upcoming matches
-        if start_date.date() < datetime.now().date():
+        if start_date.date() < date.today():
             errors.append("--from date must be today or in the future for upcoming matches.")
 
         # Validate date range size (only if both dates are specified and end_date is not None)
@@ -295,7 +306,8 @@ class CLIArgumentValidator:
                 end_season = self._parse_season(to_date)
             else:
                 # Default to current year for end if not specified
-                end_season = (str(datetime.now().year), datetime.now().year)
+                current_year = datetime.now().year
+                end_season = (str(current_year), current_year)
         except ValueError as e:
             errors.append(str(e))
             return errors
@@ -315,7 +327,8 @@ class CLIArgumentValidator:
 
         return errors
 
-    def _parse_season(self, season_str: str) -> tuple[str, int]:
+    @staticmethod
+    def _parse_season(season_str: str) -> tuple[str, int]:
         """
         Parse season string and return (season_format, end_year).
 
@@ -332,52 +345,54 @@ class CLIArgumentValidator:
             return str(current_year), current_year
 
         # YYYY format
-        if re.match(r"^\d{4}$", season_str):
-            year = int(season_str)
-            return season_str, year
+        if len(season_str) == 4 and season_str.isdecimal():
+            return season_str, int(season_str)
 
         # YYYY-YYYY format
-        if re.match(r"^\d{4}-\d{4}$", season_str):
-            start_year, end_year = map(int, season_str.split("-"))
-            if end_year != start_year + 1:
-                raise ValueError(
-                    f"Invalid season range: '{season_str}'. The second year must be exactly one year after the first year."
-                )
-            return season_str, end_year
+        start_year, separator, end_year = season_str.partition("-")
+        if not (
+            separator
+            and len(start_year) == len(end_year) == 4
+            and start_year.isdecimal()
+            and end_year.isdecimal()
+        ):
+            raise ValueError(
+                f"Invalid season format: '{season_str}'. "
+                "Expected format: YYYY, YYYY-YYYY, or 'now' (e.g., 2023, 2022-2023, now)."
+            )
 
-        raise ValueError(
-            f"Invalid season format: '{season_str}'. Expected format: YYYY, YYYY-YYYY, or 'now' (e.g., 2023, 2022-2023, now)."
-        )
+        if int(end_year) != int(start_year) + 1:
+            raise ValueError(
+                f"Invalid season range: '{season_str}'. The second year must be exactly one year after the first year."
+            )
+        return season_str, int(end_year)
 
-    def _validate_storage(self, storage: str) -> list[str]:
+    @staticmethod
+    def _validate_storage(storage: str) -> list[str]:
         """Validates the storage argument."""
-        try:
-            StorageType(storage)
-        except ValueError:
-            return [
-                f"Invalid storage type: '{storage}'. Supported storage types are: "
-                f"{', '.join([e.value for e in StorageType])}"
-            ]
+        if storage not in STORAGE_TYPE_VALUES:
+            return [f"Invalid storage type: '{storage}'. Supported storage types are: {SUPPORTED_STORAGE_TYPES}"]
         return []
 
-    def _validate_file_args(self, args: argparse.Namespace) -> list[str]:
+    @staticmethod
+    def _validate_file_args(args: argparse.Namespace) -> list[str]:
         """Validates the file_path and file_format arguments."""
         errors = []
 
         extracted_format = None
         if args.file_path:
-            if "." in args.file_path:
-                extracted_format = args.file_path.split(".")[-1].lower()
+            extension = os.path.splitext(args.file_path)[1]
+            if extension:
+                extracted_format = extension[1:].lower()
             else:
                 errors.append(
                     f"File path '{args.file_path}' must include a valid file extension (e.g., '.csv' or '.json')."
                 )
 
         if args.format:
-            if args.format not in [f.value for f in StorageFormat]:
+            if args.format not in STORAGE_FORMAT_VALUES:
                 errors.append(
-                    f"Invalid file format: '{args.format}'. Supported formats are: "
-                    f"{', '.join(f.value for f in StorageFormat)}."
+                    f"Invalid file format: '{args.format}'. Supported formats are: {SUPPORTED_STORAGE_FORMATS}."
                 )
             elif extracted_format and args.format != extracted_format:
                 errors.append(
@@ -385,10 +400,10 @@ class CLIArgumentValidator:
                 )
 
         elif extracted_format:
-            if extracted_format not in [f.value for f in StorageFormat]:
+            if extracted_format not in STORAGE_FORMAT_VALUES:
                 errors.append(
                     f"Invalid file extension in file path: '{extracted_format}'. Supported formats are: "
-                    f"{', '.join(f.value for f in StorageFormat)}."
+                    f"{SUPPORTED_STORAGE_FORMATS}."
                 )
             args.format = extracted_format
 
@@ -397,7 +412,8 @@ class CLIArgumentValidator:
 
         return errors
 
-    def _validate_max_pages(self, command: str, max_pages: int | None) -> list[str]:
+    @staticmethod
+    def _validate_max_pages(command: str, max_pages: int | None) -> list[str]:
         """Validates the max_pages argument (only for scrape_historic)."""
         errors = []
 
@@ -409,27 +425,22 @@ class CLIArgumentValidator:
 
         return errors
 
-    def _validate_proxies(self, proxies: list[str] | None) -> list[str]:
+    @staticmethod
+    def _validate_proxies(proxies: list[str] | None) -> list[str]:
         """Validates proxy format (supports http, https, socks5 with optional auth)."""
-        errors = []
         if not proxies:
-            return errors
+            return []
 
-        proxy_pattern = re.compile(
-            r"^(?P<scheme>https?|socks5|socks4)://(?P<host>[\w\.-]+):(?P<port>\d+)(?:\s+(?P<user>\S+)\s+(?P<pass>\S+))?$"
-        )
-
-        for proxy in proxies:
-            if not proxy_pattern.match(proxy):
-                errors.append(
-                    f"Invalid proxy format: '{proxy}'. Expected format: "
-                    f"'http[s]://host:port [user pass]' or 'socks5://host:port [user pass]'."
-                )
-
-        return errors
+        return [
+            f"Invalid proxy format: '{proxy}'. Expected format: "
+            f"'http[s]://host:port [user pass]' or 'socks5://host:port [user pass]'."
+            for proxy in proxies
+            if not _is_valid_proxy(proxy)
+        ]
 
+    @staticmethod
     def _validate_browser_settings(
-        self, user_agent: str | None, locale_timezone: str | None, timezone_id: str | None
+        user_agent: str | None, locale_timezone: str | None, timezone_id: str | None
     ) -> list[str]:
         """Validates the browser-related CLI arguments."""
         errors = []
@@ -445,17 +456,16 @@ class CLIArgumentValidator:
 
         return errors
 
-    def _validate_odds_format(self, odds_format: str) -> list[str]:
+    @staticmethod
+    def _validate_odds_format(odds_format: str) -> list[str]:
         """Validates the odds format argument."""
         errors = []
-        try:
-            OddsFormat(odds_format)
-        except ValueError:
-            supported_formats = ", ".join([f.value for f in OddsFormat])
-            errors.append(f"Invalid odds format: '{odds_format}'. Supported formats are: {supported_formats}.")
+        if odds_format not in ODDS_FORMAT_VALUES:
+            errors.append(f"Invalid odds format: '{odds_format}'. Supported formats are: {SUPPORTED_ODDS_FORMATS}.")
         return errors
 
-    def _validate_concurrency_tasks(self, concurrency_tasks: int) -> list[str]:
+    @staticmethod
+    def _validate_concurrency_tasks(concurrency_tasks: int) -> list[str]:
         """Validates the concurrency tasks argument."""
         errors = []
         if not isinstance(concurrency_tasks, int) or concurrency_tasks <= 0:
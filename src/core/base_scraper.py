@@ -2,11 +2,11 @@ import asyncio
 from datetime import UTC, datetime
 import json
 import logging
-import re
 from typing import Any
 
 from bs4 import BeautifulSoup
-from playwright.async_api import Page, TimeoutError
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.core.browser_helper import BrowserHelper
 from src.core.odds_portal_market_extractor import OddsPortalMarketExtractor
@@ -15,6 +15,26 @@ from src.utils.constants import ODDSPORTAL_BASE_URL
 from src.utils.odds_format_enum import OddsFormat
 from src.utils.utils import clean_html_text
 
+# Links inside event rows, i.e. elements with a class token starting with `eventRow`.
+EVENT_ROW_LINKS_SELECTOR = '[class^="eventRow"] a[href], [class*=" eventRow"] a[href]'
+
+# True once the odds format dropdown button shows the requested format.
+ODDS_FORMAT_SELECTED_SCRIPT = (
+    "({ selector, format }) => { const button = document.querySelector(selector); "
+    "return !!button && button.innerText.trim().toLowerCase() === format.toLowerCase(); }"
+)
+
+# Reads the event header's `data` attribute in the page, so only that string crosses over from the browser.
+EVENT_HEADER_DATA_SCRIPT = (
+    "() => { const header = document.getElementById('react-event-header'); "
+    "return header ? header.getAttribute('data') : null; }"
+)
+
+
+def _format_utc(moment: datetime) -> str:
+    """Format a UTC datetime as `YYYY-MM-DD HH:MM:SS UTC`."""
+    return f"{moment:%Y-%m-%d %H:%M:%S} UTC"
+
 
 class BaseScraper:
     """
@@ -64,8 +84,8 @@ class BaseScraper:
                 return
 
             await dropdown_button.click()
-            await page.wait_for_timeout(10000)
             format_option_selector = "div.group > div.dropdown-content > ul > li > a"
+            await page.wait_for_selector(format_option_selector, state="visible", timeout=5000)
             format_options = await page.query_selector_all(format_option_selector)
 
             for option in format_options:
@@ -74,13 +94,17 @@ class BaseScraper:
                 if odds_format.value.lower() in option_text.lower():
                     self.logger.info(f"Selecting odds format: {option_text}")
                     await option.click()
-                    await page.wait_for_timeout(10000)
+                    await page.wait_for_function(
+                        ODDS_FORMAT_SELECTED_SCRIPT,
+                        arg={"selector": button_selector, "format": odds_format.value},
+                        timeout=5000,
+                    )
                     self.logger.info(f"Odds format changed to '{odds_format.value}'.")
                     return
 
             self.logger.warning(f"Desired odds format '{odds_format.value}' not found in dropdown options.")
 
-        except TimeoutError:
+        except PlaywrightTimeoutError:
             self.logger.error("Timeout while setting odds format. Dropdown may not have loaded.")
 
         except Exception as e:
@@ -99,14 +123,14 @@ class BaseScraper:
         try:
             html_content = await page.content()
             soup = BeautifulSoup(html_content, "lxml")
-            event_rows = soup.find_all(class_=re.compile("^eventRow"))
-            self.logger.info(f"Found {len(event_rows)} event rows.")
+            event_row_links = soup.select(EVENT_ROW_LINKS_SELECTOR)
+            self.logger.info(f"Found {len(event_row_links)} links in event rows.")
 
+            # Match pages are at least four path segments deep (sport/country/league/match).
             match_links = {
-                f"{ODDSPORTAL_BASE_URL}{link['href']}"
-                for row in event_rows
-                for link in row.find_all("a", href=True)
-                if len(link["href"].strip("/").split("/")) > 3
+                f"{ODDSPORTAL_BASE_URL}{href}"
+                for link in event_row_links
+                if (href := link["href"]).count("/") - href.startswith("/") - href.endswith("/") >= 3
             }
 
             self.logger.info(f"Extracted {len(match_links)} unique match links.")
@@ -142,38 +166,48 @@ class BaseScraper:
             List[Dict[str, Any]]: A list of dictionaries containing scraped odds data.
         """
         self.logger.info(f"Starting to scrape odds for {len(match_links)} match links...")
-        semaphore = asyncio.Semaphore(concurrent_scraping_task)
+        results: list[dict[str, Any] | None] = [None] * len(match_links)
+        pending_links = enumerate(match_links)
         failed_links = []
 
-        async def scrape_with_semaphore(link):
-            async with semaphore:
-                tab = None
+        async def scrape_worker():
+            # Each worker reuses one tab for its links and only replaces it after a failure.
+            # Workers share one iterator, so each link is taken by exactly one of them.
+            tab = None
 
-                try:
-                    tab = await self.playwright_manager.context.new_page()
-                    data = await self._scrape_match_data(
-                        page=tab,
-                        sport=sport,
-                        match_link=link,
-                        markets=markets,
-                        scrape_odds_history=scrape_odds_history,
-                        target_bookmaker=target_bookmaker,
-                        preview_submarkets_only=preview_submarkets_only,
-                    )
-                    self.logger.info(f"Successfully scraped match link: {link}")
-                    return data
-
-                except Exception as e:
-                    self.logger.error(f"Error scraping link {link}: {e}")
+            try:
+                for index, link in pending_links:
+                    try:
+                        if tab is None or tab.is_closed():
+                            tab = await self.playwright_manager.context.new_page()
+                        results[index] = await self._scrape_match_data(
+                            page=tab,
+                            sport=sport,
+                            match_link=link,
+                            markets=markets,
+                            scrape_odds_history=scrape_odds_history,
+                            target_bookmaker=target_bookmaker,
+                            preview_submarkets_only=preview_submarkets_only,
+                        )
+                    except Exception as e:
+                        self.logger.error(f"Error scraping link {link}: {e}")
+
+                    if results[index] is not None:
+                        self.logger.info(f"Successfully scraped match link: {link}")
+                        continue
+
+                    # `_scrape_match_data` reports failures by returning None; the tab may have been left broken
                     failed_links.append(link)
-                    return None
-
-                finally:
                     if tab:
-                        await tab.close()
+                        stale_tab, tab = tab, None
+                        await stale_tab.close()
 
-        tasks = [scrape_with_semaphore(link) for link in match_links]
-        results = await asyncio.gather(*tasks)
+            finally:
+                if tab:
+                    await tab.close()
+
+        workers = [scrape_worker() for _ in range(min(concurrent_scraping_task, len(match_links)))]
+        await asyncio.gather(*workers)
         odds_data = [result for result in results if result is not None]
         self.logger.info(f"Successfully scraped odds data for {len(odds_data)} matches.")
 
@@ -268,18 +302,9 @@ class BaseScraper:
                 # If we can't find the selector, try to get the content anyway
                 self.logger.warning("React event header selector not found, attempting to parse existing content")
 
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-            event_header_div = soup.find("div", id="react-event-header")
-
-            if not event_header_div:
-                self.logger.warning("React event header div not found in page content")
-                return None
-
-            # Check if the div has the 'data' attribute
-            data_attribute = event_header_div.get("data")
+            data_attribute = await page.evaluate(EVENT_HEADER_DATA_SCRIPT)
             if not data_attribute:
-                self.logger.warning("React event header div found but 'data' attribute is missing")
+                self.logger.warning("React event header div or its 'data' attribute not found in page")
                 return None
 
             try:
@@ -292,14 +317,13 @@ class BaseScraper:
             event_data = json_data.get("eventData", {})
             unix_timestamp = event_body.get("startDate")
 
-            match_date = (
-                datetime.fromtimestamp(unix_timestamp, tz=UTC).strftime("%Y-%m-%d %H:%M:%S %Z")
-                if unix_timestamp
-                else None
-            )
+            match_date = _format_utc(datetime.fromtimestamp(unix_timestamp, tz=UTC)) if unix_timestamp else None
+            venue_town = event_body.get("venueTown") or None
+            if venue_town and not venue_town.isascii():
+                venue_town = venue_town.encode("ascii", "ignore").decode("ascii")
 
             return {
-                "scraped_date": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S %Z"),
+                "scraped_date": _format_utc(datetime.now(UTC)),
                 "match_date": match_date,
                 "home_team": event_data.get("home"),
                 "away_team": event_data.get("away"),
@@ -308,9 +332,7 @@ class BaseScraper:
                 "away_score": event_body.get("awayResult"),
                 "partial_results": clean_html_text(event_body.get("partialresult")),
                 "venue": event_body.get("venue"),
-                "venue_town": event_body.get("venueTown").encode("ascii", "ignore").decode("ascii")
-                if event_body.get("venueTown")
-                else None,
+                "venue_town": venue_town,
                 "venue_country": event_body.get("venueCountry"),
             }
 
@@ -1,10 +1,47 @@
+import asyncio
 import logging
-import time
+import re
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.core.odds_portal_selectors import OddsPortalSelectors
 
+# Reads the page height and the number of elements matching an optional CSS selector, then scrolls to the bottom.
+SCROLL_AND_MEASURE_SCRIPT = """(selector) => {
+    const height = document.body.scrollHeight;
+    const count = selector ? document.querySelectorAll(selector).length : 0;
+    window.scrollTo(0, height);
+    return [height, count];
+}"""
+
+# Scrolls one step further down, so lazily rendered rows below the viewport get added to the DOM.
+SCROLL_STEP_SCRIPT = "window.scrollBy(0, 500)"
+
+# Resolves as soon as the document grows past the height it had before the last scroll.
+PAGE_HEIGHT_GREW_SCRIPT = "(height) => document.body.scrollHeight > height"
+
+# Reads the text of every element matched by a selector in a single round-trip.
+TEXT_CONTENTS_SCRIPT = "(elements) => elements.map((element) => element.textContent)"
+
+# Reads the text of the first element matched by each CSS selector (null when nothing matches).
+FIRST_MATCH_TEXTS_SCRIPT = (
+    "(selectors) => selectors.map((selector) => document.querySelector(selector)?.textContent ?? null)"
+)
+
+# Checks in the browser whether the page title or text mentions the given lowercased text.
+PAGE_MENTIONS_TEXT_SCRIPT = (
+    "(text) => `${document.title} ${document.body?.textContent ?? ''}`.toLowerCase().includes(text)"
+)
+
+# CSS selectors marking the active market tab, in order of preference.
+ACTIVE_TAB_SELECTORS = ("li.active", "li[class*='active']", ".active", "[class*='active']")
+
+# Text identifying the button that opens the dropdown of market tabs that do not fit in the tab bar.
+MORE_BUTTON_TEXT_PATTERN = re.compile(r"more|\.\.\.", re.IGNORECASE)
+
 
 class BrowserHelper:
     """
@@ -22,6 +59,9 @@ class BrowserHelper:
         Initialize the BrowserHelper class.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
+        # (host, selector) of banners already dismissed per browser context, as consent is kept in its cookies;
+        # weakly keyed so closed contexts are not kept alive
+        self._dismissed_cookie_banners: WeakKeyDictionary[BrowserContext, set[tuple[str, str]]] = WeakKeyDictionary()
 
     # =============================================================================
     # COOKIE BANNER MANAGEMENT
@@ -31,6 +71,9 @@ class BrowserHelper:
         """
         Dismiss the cookie banner if it appears on the page.
 
+        Once dismissed, later calls for the same browser context and site return immediately, since the consent
+        is remembered and the banner will not show again.
+
         Args:
             page (Page): The Playwright page instance to interact with.
             selector (str): The CSS selector for the cookie banner's accept button.
@@ -42,11 +85,17 @@ class BrowserHelper:
         if selector is None:
             selector = OddsPortalSelectors.COOKIE_BANNER
 
+        dismissed_key = (urlparse(page.url).netloc, selector)
+        if dismissed_key in self._dismissed_cookie_banners.get(page.context, ()):
+            self.logger.debug("Cookie banner already dismissed for this site.")
+            return True
+
         try:
             self.logger.info("Checking for cookie banner...")
             await page.wait_for_selector(selector, timeout=timeout)
             self.logger.info("Cookie banner found. Dismissing it.")
             await page.click(selector)
+            self._dismissed_cookie_banners.setdefault(page.context, set()).add(dismissed_key)
             return True
 
         except TimeoutError:
@@ -61,15 +110,19 @@ class BrowserHelper:
     # MARKET NAVIGATION
     # =============================================================================
 
-    async def navigate_to_market_tab(self, page: Page, market_tab_name: str, timeout=10000):
+    async def navigate_to_market_tab(self, page: Page, market_tab_name: str, timeout=10000, verify: bool = False):
         """
         Navigate to a specific market tab by its name.
         Now supports hidden markets under the "More" dropdown.
 
+        A successful click on the tab counts as success; callers that need the active tab confirmed
+        before returning can pass `verify=True`.
+
         Args:
             page: The Playwright page instance.
             market_tab_name: The name of the market tab to navigate to (e.g., 'Over/Under', 'Draw No Bet').
             timeout: Timeout in milliseconds.
+            verify: Whether to check that the tab is active after clicking it (default: False).
 
         Returns:
             bool: True if the market tab was successfully selected, False otherwise.
@@ -84,8 +137,7 @@ class BrowserHelper:
                 break
 
         if market_found:
-            # Verify that the tab is actually active
-            if await self._verify_tab_is_active(page, market_tab_name):
+            if not verify or await self._verify_tab_is_active(page, market_tab_name):
                 self.logger.info(f"Successfully navigated to {market_tab_name} tab (directly visible).")
                 return True
             else:
@@ -94,8 +146,7 @@ class BrowserHelper:
         # Second attempt: Try to find the market in the "More" dropdown
         self.logger.info(f"Market '{market_tab_name}' not found in visible tabs. Checking 'More' dropdown...")
         if await self._click_more_if_market_hidden(page, market_tab_name, timeout):
-            # Verify that the tab is actually active
-            if await self._verify_tab_is_active(page, market_tab_name):
+            if not verify or await self._verify_tab_is_active(page, market_tab_name):
                 self.logger.info(f"Successfully navigated to {market_tab_name} tab (via 'More' dropdown).")
                 return True
             else:
@@ -122,14 +173,15 @@ class BrowserHelper:
         Scrolls down the page until no new content is loaded or a timeout is reached.
 
         This method is useful for pages that load content dynamically as the user scrolls.
-        It attempts to scroll the page to the bottom multiple times, waiting for a specified
-        interval between scrolls. Scrolling stops when no new content is detected, a timeout
-        occurs, or the maximum number of scroll attempts is reached.
+        It attempts to scroll the page to the bottom multiple times, returning from each wait as
+        soon as the page grows. A scroll only counts as stable once a full `scroll_pause_time` has
+        passed without new content, so the page is idle for `max_scroll_attempts * scroll_pause_time`
+        before scrolling stops. Scrolling also stops when a timeout occurs.
 
         Args:
             page (Page): The Playwright page instance to interact with.
             timeout (int): The maximum time (in seconds) to attempt scrolling (default: 30).
-            scroll_pause_time (int): The time (in seconds) to pause between scrolls (default: 3).
+            scroll_pause_time (int): The longest time (in seconds) to wait for new content per scroll (default: 3).
             max_scroll_attempts (int): The maximum number of attempts to detect new content (default: 5).
             content_check_selector (str): Optional CSS selector to check for new content after scrolling.
 
@@ -137,31 +189,27 @@ class BrowserHelper:
             bool: True if scrolling completed successfully, False otherwise.
         """
         self.logger.info("Will scroll to the bottom of the page to load all content.")
-        end_time = time.time() + timeout
-        last_height = await page.evaluate("document.body.scrollHeight")
-        last_element_count = 0
+        # The event loop clock is monotonic, so wall-clock adjustments cannot cut scrolling short or extend it
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + timeout
         stable_count_attempts = 0
+        pause_timeout = scroll_pause_time * 1000
+
+        # Each measurement also scrolls to the bottom, so every iteration costs a single round-trip
+        last_height, last_element_count = await page.evaluate(SCROLL_AND_MEASURE_SCRIPT, content_check_selector)
 
-        # Get initial element count if selector is provided
         if content_check_selector:
-            initial_elements = await page.query_selector_all(content_check_selector)
-            last_element_count = len(initial_elements)
             self.logger.info(f"Initial element count: {last_element_count}")
 
         self.logger.info(f"Initial page height: {last_height}")
 
-        while time.time() < end_time:
-            # Scroll to bottom
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(scroll_pause_time * 1000)
+        while loop.time() < end_time:
+            # Returns as soon as the page grows, so an unchanged height means a full pause passed without new content
+            await self._wait_for_new_content(page, last_height, pause_timeout)
 
-            new_height = await page.evaluate("document.body.scrollHeight")
-            new_element_count = 0
+            new_height, new_element_count = await page.evaluate(SCROLL_AND_MEASURE_SCRIPT, content_check_selector)
 
-            # Count elements if selector is provided
             if content_check_selector:
-                elements = await page.query_selector_all(content_check_selector)
-                new_element_count = len(elements)
                 self.logger.info(f"Current element count: {new_element_count} (height: {new_height})")
 
                 # Check if element count is stable
@@ -198,49 +246,48 @@ class BrowserHelper:
         """
         Scrolls the page until an element matching the selector and text is visible, then clicks its parent element.
 
+        Each step waits up to `scroll_pause_time` for the element to show up, returning as soon as it does, then
+        scrolls further down so lazily rendered rows get added to the DOM.
+
         Args:
             page (Page): The Playwright page instance.
             selector (str): The CSS selector of the element.
             text (str): Optional. The text content to match.
             timeout (int): Timeout in seconds (default: 20).
-            scroll_pause_time (int): Pause time in seconds between scrolls (default: 3).
+            scroll_pause_time (int): The longest time (in seconds) to wait for the element per scroll (default: 3).
 
         Returns:
             bool: True if the parent element was clicked successfully, False otherwise.
         """
-        end_time = time.time() + timeout
-
-        while time.time() < end_time:
-            elements = await page.query_selector_all(selector)
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + timeout
 
-            for element in elements:
-                if text:
-                    element_text = await element.text_content()
+        try:
+            element = self._text_locator(page, selector, text).locator("visible=true").first
 
-                    if element_text and text in element_text:
-                        bounding_box = await element.bounding_box()
+            while (remaining := end_time - loop.time()) > 0:
+                try:
+                    await element.scroll_into_view_if_needed(timeout=min(scroll_pause_time, remaining) * 1000)
+                except PlaywrightTimeoutError:
+                    await page.evaluate(SCROLL_STEP_SCRIPT)
+                    continue
 
-                        if bounding_box:
-                            self.logger.info(f"Element with text '{text}' is visible. Clicking its parent.")
-                            parent_element = await element.evaluate_handle("element => element.parentElement")
-                            await parent_element.click()
-                            return True
+                if text:
+                    self.logger.info(f"Element with text '{text}' is visible. Clicking its parent.")
                 else:
-                    bounding_box = await element.bounding_box()
-                    if bounding_box:
-                        self.logger.info("Element is visible. Clicking its parent.")
-                        parent_element = await element.evaluate_handle("element => element.parentElement")
-                        await parent_element.click()
-                        return True
+                    self.logger.info("Element is visible. Clicking its parent.")
+                await element.locator("xpath=..").click()
+                return True
 
-            await page.evaluate("window.scrollBy(0, 500);")
-            await page.wait_for_timeout(scroll_pause_time * 1000)
+            self.logger.warning(
+                f"Failed to find and click parent of element matching selector '{selector}' with text '{text}' "
+                f"within timeout."
+            )
+            return False
 
-        self.logger.warning(
-            f"Failed to find and click parent of element matching selector '{selector}' with text '{text}' "
-            f"within timeout."
-        )
-        return False
+        except Exception as e:
+            self.logger.error(f"Error while scrolling to element matching selector '{selector}': {e}")
+            return False
 
     # =============================================================================
     # PRIVATE HELPER METHODS
@@ -274,13 +321,47 @@ class BrowserHelper:
             self.logger.error(f"Error waiting for or clicking selector '{selector}': {e}")
             return False
 
+    async def _wait_for_new_content(self, page: Page, last_height: int, timeout: float) -> bool:
+        """
+        Waits until the page grows past `last_height`.
+
+        Args:
+            page (Page): The Playwright page instance.
+            last_height (int): The document height before the last scroll.
+            timeout (float): The maximum time (in milliseconds) to wait for the page to grow.
+
+        Returns:
+            bool: True if the page grew within the timeout, False otherwise.
+        """
+        try:
+            await page.wait_for_function(PAGE_HEIGHT_GREW_SCRIPT, arg=last_height, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def _text_locator(self, page: Page, selector: str, text: str | None = None) -> Locator:
+        """
+        Builds a locator for the elements matching a selector, optionally narrowed to those containing a text.
+
+        The text is matched as a case-sensitive substring of the element's text content, inside the browser.
+
+        Args:
+            page (Page): The Playwright page instance to interact with.
+            selector (str): The selector for the elements to search.
+            text (str): Optional. The text content to match as a substring.
+
+        Returns:
+            Locator: The locator for the matching elements.
+        """
+        locator = page.locator(selector)
+        return locator.filter(has_text=re.compile(re.escape(text))) if text else locator
+
     async def _click_by_text(self, page: Page, selector: str, text: str) -> bool:
         """
         Attempts to click an element based on its text content.
 
-        This method searches for all elements matching a specific selector, retrieves their
-        text content, and checks if the provided text is a substring of the element's text.
-        If a match is found, the method clicks the element.
+        This method looks, inside the browser, for the first element matching a specific selector
+        whose text content contains the provided text. If a match is found, the method clicks it.
 
         Args:
             page (Page): The Playwright page instance to interact with.
@@ -294,14 +375,11 @@ class BrowserHelper:
             Exception: Logs the error and returns False if an issue occurs during execution.
         """
         try:
-            elements = await page.query_selector_all(selector)
+            element = self._text_locator(page, selector, text).first
 
-            for element in elements:
-                element_text = await element.text_content()
-
-                if element_text and text in element_text:
-                    await element.click()
-                    return True
+            if await element.count():
+                await element.click()
+                return True
 
             self.logger.info(f"Element with text '{text}' not found.")
             return False
@@ -326,14 +404,12 @@ class BrowserHelper:
             more_clicked = False
             for selector in OddsPortalSelectors.MORE_BUTTON_SELECTORS:
                 try:
-                    more_element = await page.query_selector(selector)
-                    if more_element:
-                        text = await more_element.text_content()
-                        if text and ("more" in text.lower() or "..." in text):
-                            self.logger.info(f"Clicking 'More' button: '{text.strip()}'")
-                            await more_element.click()
-                            more_clicked = True
-                            break
+                    more_element = page.locator(selector).filter(has_text=MORE_BUTTON_TEXT_PATTERN).first
+                    if await more_element.count():
+                        self.logger.info(f"Clicking 'More' button matching '{selector}'")
+                        await more_element.click()
+                        more_clicked = True
+                        break
                 except Exception as e:
                     self.logger.debug(f"Exception while searching for 'More' button with selector '{selector}': {e}")
                     continue
@@ -344,16 +420,15 @@ class BrowserHelper:
 
             await page.wait_for_timeout(1000)
 
+            # The dropdown selectors already match the market name with `:has-text()`.
             dropdown_selectors = OddsPortalSelectors.get_dropdown_selectors_for_market(market_tab_name)
             for selector in dropdown_selectors:
                 try:
-                    dropdown_element = await page.query_selector(selector)
-                    if dropdown_element:
-                        text = await dropdown_element.text_content()
-                        if text and market_tab_name.lower() in text.lower():
-                            self.logger.info(f"Found '{market_tab_name}' in dropdown. Clicking...")
-                            await dropdown_element.click()
-                            return True
+                    dropdown_element = page.locator(selector).first
+                    if await dropdown_element.count():
+                        self.logger.info(f"Found '{market_tab_name}' in dropdown. Clicking...")
+                        await dropdown_element.click()
+                        return True
                 except Exception as e:
                     self.logger.debug(
                         f"Exception while searching for market '{market_tab_name}' in dropdown with selector "
@@ -361,16 +436,18 @@ class BrowserHelper:
                     )
                     continue
 
-            self.logger.info("Debugging dropdown content:")
-            dropdown_items = await page.query_selector_all(OddsPortalSelectors.DROPDOWN_DEBUG_ELEMENTS)
-            for item in dropdown_items[:10]:  # Limit to first 10 items
+            # Listing the dropdown costs a browser round-trip, so only do it when the listing would be logged
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Debugging dropdown content:")
                 try:
-                    text = await item.text_content()
-                    if text and text.strip():
-                        self.logger.info(f"  Dropdown item: '{text.strip()}'")
+                    dropdown_texts = await page.eval_on_selector_all(
+                        OddsPortalSelectors.DROPDOWN_DEBUG_ELEMENTS, TEXT_CONTENTS_SCRIPT
+                    )
+                    for text in dropdown_texts[:10]:  # Limit to first 10 items
+                        if text and text.strip():
+                            self.logger.info(f"  Dropdown item: '{text.strip()}'")
                 except Exception as e:
-                    self.logger.debug(f"Exception while logging dropdown item: {e}")
-                    continue
+                    self.logger.debug(f"Exception while logging dropdown items: {e}")
 
             return False
 
@@ -393,24 +470,21 @@ class BrowserHelper:
             # Wait a bit for the tab switch to complete
             await page.wait_for_timeout(500)
 
-            # Check for active tab indicators
-            active_selectors = ["li.active", "li[class*='active']", ".active", "[class*='active']"]
-
-            for selector in active_selectors:
-                try:
-                    active_element = await page.query_selector(selector)
-                    if active_element:
-                        text = await active_element.text_content()
-                        if text and market_tab_name.lower() in text.lower():
-                            self.logger.info(f"Tab '{market_tab_name}' is confirmed active")
-                            return True
-                except Exception as e:
-                    self.logger.debug(f"Exception checking active selector '{selector}': {e}")
-                    continue
+            # Check for active tab indicators, reading all of them in a single round-trip
+            try:
+                active_texts = await page.evaluate(FIRST_MATCH_TEXTS_SCRIPT, list(ACTIVE_TAB_SELECTORS))
+            except Exception as e:
+                self.logger.debug(f"Exception checking active selectors: {e}")
+                active_texts = []
+
+            market_name = market_tab_name.lower()
+            for text in active_texts:
+                if text and market_name in text.lower():
+                    self.logger.info(f"Tab '{market_tab_name}' is confirmed active")
+                    return True
 
-            # Alternative: check if the market name appears in the current URL or page content
-            page_content = await page.content()
-            if market_tab_name and market_tab_name.lower() in page_content.lower():
+            # Alternative: check if the market name appears in the page, without transferring its content
+            if market_name and await page.evaluate(PAGE_MENTIONS_TEXT_SCRIPT, market_name):
                 self.logger.info(f"Market '{market_tab_name}' found in page content")
                 return True
 
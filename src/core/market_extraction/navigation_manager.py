@@ -1,9 +1,16 @@
 import logging
 
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.core.browser_helper import BrowserHelper
 
+# Resolves once the active tab's text contains the given lowercased market name.
+ACTIVE_MARKET_TAB_SCRIPT = """(name) => {
+    const activeTab = document.querySelector("li.active, li[class*='active'], .active");
+    return Boolean(activeTab?.textContent?.toLowerCase().includes(name));
+}"""
+
 
 class NavigationManager:
     """Handles browser navigation for market extraction."""
@@ -11,6 +18,7 @@ class NavigationManager:
     DEFAULT_TIMEOUT = 5000
     SCROLL_PAUSE_TIME = 2000
     MARKET_SWITCH_WAIT_TIME = 3000
+    MARKET_SWITCH_POLLING_INTERVAL = 100
 
     def __init__(self, browser_helper: BrowserHelper):
         """Initialize NavigationManager."""
@@ -27,33 +35,37 @@ class NavigationManager:
         """
         Wait for the market switch to complete and verify the correct market is active.
 
+        Returns as soon as the active tab shows the market, waiting at most `max_attempts` times
+        `MARKET_SWITCH_WAIT_TIME`.
+
         Args:
             page (Page): The Playwright page instance.
             market_name (str): The name of the market that should be active.
-            max_attempts (int): Maximum number of verification attempts.
+            max_attempts (int): Number of `MARKET_SWITCH_WAIT_TIME` periods to wait for at most.
 
         Returns:
             bool: True if the market switch is confirmed, False otherwise.
         """
         self.logger.info(f"Waiting for market switch to complete for: {market_name}")
 
-        for attempt in range(max_attempts):
-            try:
-                # Wait for the market switch animation to complete
-                await page.wait_for_timeout(self.MARKET_SWITCH_WAIT_TIME)
+        timeout = self.MARKET_SWITCH_WAIT_TIME * max_attempts
+
+        try:
+            await page.wait_for_function(
+                ACTIVE_MARKET_TAB_SCRIPT,
+                arg=market_name.lower(),
+                timeout=timeout,
+                polling=self.MARKET_SWITCH_POLLING_INTERVAL,
+            )
+            self.logger.info(f"Market switch confirmed: {market_name} is active")
+            return True
 
-                # Check if the market tab is active
-                active_tab = await page.query_selector("li.active, li[class*='active'], .active")
-                if active_tab:
-                    tab_text = await active_tab.text_content()
-                    if tab_text and market_name.lower() in tab_text.lower():
-                        self.logger.info(f"Market switch confirmed: {market_name} is active")
-                        return True
+        except PlaywrightTimeoutError:
+            self.logger.warning(f"Market switch verification failed after {timeout}ms")
 
-            except Exception as e:
-                self.logger.warning(f"Market switch verification attempt {attempt + 1} failed: {e}")
+        except Exception as e:
+            self.logger.warning(f"Market switch verification failed: {e}")
 
-        self.logger.warning(f"Market switch verification failed after {max_attempts} attempts")
         return False
 
     async def select_specific_market(self, page: Page, specific_market: str) -> bool:
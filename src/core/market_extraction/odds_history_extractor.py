@@ -1,6 +1,29 @@
+import asyncio
 import logging
 
-from playwright.async_api import Page
+from playwright.async_api import ElementHandle, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+BOOKMAKER_ROW_SELECTOR = "div.border-black-borders.flex.h-9"
+ODDS_BLOCK_SELECTOR = "div.flex-center.flex-col.font-bold"
+ODDS_MOVEMENT_SELECTOR = "h3:text('Odds movement')"
+
+# Serializes the odds movement modal (the heading's parent) in the same round-trip that resolves it.
+MODAL_HTML_SCRIPT = "(heading) => heading.parentElement?.innerHTML ?? null"
+
+# True once the odds movement modal read last is gone, hidden or shows other content than what was read from it.
+MODAL_REPLACED_SCRIPT = """([heading, html]) => !heading.isConnected
+    || heading.getClientRects().length === 0
+    || heading.parentElement?.innerHTML !== html"""
+
+# Maximum time (ms) for the previous odds movement modal to make way for the next one.
+MODAL_REPLACED_TIMEOUT = 3000
+
+# Returns [index, logo title] for every given bookmaker row whose logo title contains the given lowercased name.
+MATCHING_BOOKMAKER_ROWS_SCRIPT = """([rows, bookmaker]) => rows.flatMap((row, index) => {
+    const title = row.querySelector("img.bookmaker-logo")?.getAttribute("title");
+    return title && title.toLowerCase().includes(bookmaker) ? [[index, title]] : [];
+})"""
 
 
 class OddsHistoryExtractor:
@@ -21,44 +44,51 @@ class OddsHistoryExtractor:
             List[str]: List of raw HTML content from modals triggered by hovering over matched odds blocks.
         """
         self.logger.info(f"Extracting odds history for bookmaker: {bookmaker_name}")
-        await page.wait_for_timeout(2000)
 
         modals_data = []
+        # Heading and HTML of the last modal read, which may still be open while the next odds block is hovered
+        previous_modal: tuple[ElementHandle, str | None] | None = None
 
         try:
-            # Find all bookmaker rows
-            rows = await page.query_selector_all("div.border-black-borders.flex.h-9")
+            await page.wait_for_selector(BOOKMAKER_ROW_SELECTOR, timeout=5000)
+
+            # Match the fetched row handles themselves in the browser, so the indices always point at these rows
+            # even if the list re-renders, and non-matching rows cost no round-trip
+            rows = await page.query_selector_all(BOOKMAKER_ROW_SELECTOR)
+            matching_rows = (
+                await page.evaluate(MATCHING_BOOKMAKER_ROWS_SCRIPT, [rows, bookmaker_name.lower()]) if rows else []
+            )
+
+            matched_rows = [(title, rows[index]) for index, title in matching_rows]
+
+            # The odds blocks of every matched row are looked up concurrently; hovering stays sequential
+            # since the page has a single pointer and only one odds movement modal at a time.
+            odds_blocks_per_row = await asyncio.gather(
+                *(row.query_selector_all(ODDS_BLOCK_SELECTOR) for _, row in matched_rows), return_exceptions=True
+            )
+
+            for (title, _), odds_blocks in zip(matched_rows, odds_blocks_per_row, strict=True):
+                if isinstance(odds_blocks, BaseException):
+                    self.logger.warning(f"Failed to process a bookmaker row: {odds_blocks}")
+                    continue
 
-            for row in rows:
                 try:
-                    logo_img = await row.query_selector("img.bookmaker-logo")
-
-                    if logo_img:
-                        title = await logo_img.get_attribute("title")
-
-                        if title and bookmaker_name.lower() in title.lower():
-                            self.logger.info(f"Found matching bookmaker row: {title}")
-                            odds_blocks = await row.query_selector_all("div.flex-center.flex-col.font-bold")
-
-                            for odds in odds_blocks:
-                                await odds.hover()
-                                await page.wait_for_timeout(2000)
-
-                                odds_movement_element = await page.wait_for_selector(
-                                    "h3:text('Odds movement')", timeout=3000
-                                )
-                                modal_wrapper = await odds_movement_element.evaluate_handle(
-                                    "node => node.parentElement"
-                                )
-                                modal_element = modal_wrapper.as_element()
-
-                                if modal_element:
-                                    html = await modal_element.inner_html()
-                                    modals_data.append(html)
-                                else:
-                                    self.logger.warning(
-                                        "Unable to retrieve odds' evolution modal: modal_element is None"
-                                    )
+                    self.logger.info(f"Found matching bookmaker row: {title}")
+
+                    for odds in odds_blocks:
+                        await odds.hover()
+
+                        if previous_modal is not None:
+                            await self._wait_for_modal_replaced(page, *previous_modal)
+
+                        odds_movement_element = await page.wait_for_selector(ODDS_MOVEMENT_SELECTOR, timeout=3000)
+                        html = await odds_movement_element.evaluate(MODAL_HTML_SCRIPT)
+                        previous_modal = (odds_movement_element, html)
+
+                        if html is not None:
+                            modals_data.append(html)
+                        else:
+                            self.logger.warning("Unable to retrieve odds' evolution modal: modal element is None")
 
                 except Exception as e:
                     self.logger.warning(f"Failed to process a bookmaker row: {e}")
@@ -66,3 +96,18 @@ class OddsHistoryExtractor:
             self.logger.warning(f"Failed to extract odds history for bookmaker {bookmaker_name}: {e}")
 
         return modals_data
+
+    async def _wait_for_modal_replaced(self, page: Page, heading: ElementHandle, html: str | None):
+        """
+        Wait until the odds movement modal read last is closed or updated, so its HTML is not recorded again.
+
+        Args:
+            page (Page): Playwright page instance.
+            heading (ElementHandle): The odds movement heading of the modal read last.
+            html (str | None): The HTML read from that modal.
+        """
+        try:
+            await page.wait_for_function(MODAL_REPLACED_SCRIPT, arg=[heading, html], timeout=MODAL_REPLACED_TIMEOUT)
+        except PlaywrightTimeoutError:
+            # Consecutive odds blocks can share the same history, in which case the modal legitimately stays the same
+            self.logger.debug("Odds movement modal unchanged after hovering the next odds block.")
@@ -3,7 +3,54 @@ import logging
 import re
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# CSS selectors of the bookmaker rows, broadest first.
+BOOKMAKER_BLOCK_SELECTOR = "div.border-black-borders"
+BOOKMAKER_ROW_SELECTOR = "div.border-black-borders.flex.h-9"
+
+# Only the bookmaker rows (and everything inside them) are built when parsing a market page.
+# The class attribute is not yet split into tokens while parsing, hence the whole-token pattern.
+BOOKMAKER_BLOCK_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)border-black-borders(?:\s|$)"))
+
+# CSS selector of the blocks holding a single odds value within a bookmaker row.
+ODDS_BLOCK_SELECTOR = "div.flex-center.flex-col.font-bold"
+
+# Month abbreviations used in odds history timestamps, keyed in lowercase.
+MONTH_NUMBERS = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1
+    )
+}
+
+
+def _collapse_duplicated_odds(value: str) -> str:
+    """Collapse odds rendered twice in a row (e.g. "1.501.50") into a single value, leaving other values as is."""
+    half, odd_length = divmod(len(value), 2)
+    if not odd_length and value[:half] == value[half:]:
+        integer, separator, fraction = value[:half].partition(".")
+        if separator and integer.isdecimal() and fraction.isdecimal():
+            return value[:half]
+    return value
+
+
+def _parse_modal_timestamp(text: str, year: int) -> datetime:
+    """
+    Parse an odds history timestamp such as "10 Jun, 14:30" in the given year.
+
+    Equivalent to `datetime.strptime(f"{text} {year}", "%d %b, %H:%M %Y")` for English month names,
+    without going through the generic format parser for every row of a modal.
+
+    Raises:
+        ValueError: If the text is not a valid timestamp in that format.
+    """
+    day, month, clock = text.split()
+    hour, minute = clock.split(":")
+    month_number = MONTH_NUMBERS.get(month.lower().removesuffix(",")) if month.endswith(",") else None
+    if month_number is None:
+        raise ValueError(f"Unknown month in timestamp: {text!r}")
+    return datetime(year, month_number, int(day), int(hour), int(minute))
 
 
 class OddsParser:
@@ -28,29 +75,31 @@ class OddsParser:
             list[dict]: A list of dictionaries containing bookmaker odds.
         """
         self.logger.info("Parsing odds from HTML content.")
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml", parse_only=BOOKMAKER_BLOCK_STRAINER)
 
         # Try broader "border-black-borders" pattern first as it works better
-        bookmaker_blocks = soup.find_all("div", class_=re.compile(r"border-black-borders"))
+        bookmaker_blocks = soup.select(BOOKMAKER_BLOCK_SELECTOR)
 
         if not bookmaker_blocks:
             # Fallback to broader selector
-            bookmaker_blocks = soup.find_all("div", class_=re.compile(r"^border-black-borders flex h-9"))
+            bookmaker_blocks = soup.select(BOOKMAKER_ROW_SELECTOR)
 
         if not bookmaker_blocks:
             self.logger.warning("No bookmaker blocks found.")
             return []
 
+        target_name = target_bookmaker.lower() if target_bookmaker else None
+
         odds_data = []
         for block in bookmaker_blocks:
             try:
                 img_tag = block.find("img", class_="bookmaker-logo")
                 bookmaker_name = img_tag["title"] if img_tag and "title" in img_tag.attrs else "Unknown"
 
-                if not bookmaker_name or (target_bookmaker and bookmaker_name.lower() != target_bookmaker.lower()):
+                if not bookmaker_name or (target_name and bookmaker_name.lower() != target_name):
                     continue
 
-                odds_blocks = block.find_all("div", class_=re.compile(r"flex-center.*flex-col.*font-bold"))
+                odds_blocks = block.select(ODDS_BLOCK_SELECTOR)
 
                 if len(odds_blocks) < len(odds_labels):
                     self.logger.warning(f"Incomplete odds data for bookmaker: {bookmaker_name}. Skipping...")
@@ -59,7 +108,7 @@ class OddsParser:
                 extracted_odds = {label: odds_blocks[i].get_text(strip=True) for i, label in enumerate(odds_labels)}
 
                 for key, value in extracted_odds.items():
-                    extracted_odds[key] = re.sub(r"(\d+\.\d+)\1", r"\1", value)
+                    extracted_odds[key] = _collapse_duplicated_odds(value)
 
                 extracted_odds["bookmaker_name"] = bookmaker_name
                 extracted_odds["period"] = period
@@ -83,24 +132,28 @@ class OddsParser:
             dict: Parsed odds history data, including historical odds and the opening odds.
         """
         self.logger.info("Parsing modal content for odds history.")
-        soup = BeautifulSoup(modal_html, "html.parser")
+        soup = BeautifulSoup(modal_html, "lxml")
 
         try:
+            # Modal timestamps carry no year: read it once so every entry, opening odds included, gets the same one
+            current_year = datetime.now(UTC).year
+            # Rows often share a timestamp, so each distinct one is only parsed once per modal
+            formatted_times: dict[str, str] = {}
+
             odds_history = []
             timestamps = soup.select("div.flex.flex-col.gap-1 > div.flex.gap-3 > div.font-normal")
             odds_values = soup.select("div.flex.flex-col.gap-1 + div.flex.flex-col.gap-1 > div.font-bold")
 
             for ts, odd in zip(timestamps, odds_values, strict=False):
                 time_text = ts.get_text(strip=True)
-                try:
-                    # Parse with explicit year to avoid deprecation warning
-                    current_year = datetime.now(UTC).year
-                    time_text_with_year = f"{time_text} {current_year}"
-                    dt = datetime.strptime(time_text_with_year, "%d %b, %H:%M %Y")
-                    formatted_time = dt.isoformat()
-                except ValueError:
-                    self.logger.warning(f"Failed to parse datetime: {time_text}")
-                    continue
+                formatted_time = formatted_times.get(time_text)
+                if formatted_time is None:
+                    try:
+                        formatted_time = _parse_modal_timestamp(time_text, current_year).isoformat()
+                    except ValueError:
+                        self.logger.warning(f"Failed to parse datetime: {time_text}")
+                        continue
+                    formatted_times[time_text] = formatted_time
 
                 odds_history.append({"timestamp": formatted_time, "odds": float(odd.get_text(strip=True))})
 
@@ -112,13 +165,12 @@ class OddsParser:
             opening_odds = None
             if opening_ts_div and opening_val_div:
                 try:
-                    # Parse with explicit year to avoid deprecation warning
-                    current_year = datetime.now(UTC).year
                     opening_time_text = opening_ts_div.get_text(strip=True)
-                    opening_time_with_year = f"{opening_time_text} {current_year}"
-                    dt = datetime.strptime(opening_time_with_year, "%d %b, %H:%M %Y")
+                    opening_time = formatted_times.get(opening_time_text)
+                    if opening_time is None:
+                        opening_time = _parse_modal_timestamp(opening_time_text, current_year).isoformat()
                     opening_odds = {
-                        "timestamp": dt.isoformat(),
+                        "timestamp": opening_time,
                         "odds": float(opening_val_div.get_text(strip=True)),
                     }
                 except ValueError:
@@ -1,9 +1,37 @@
+from functools import lru_cache
 import logging
 import re
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# CSS selector of the submarket rows.
+SUBMARKET_ROW_SELECTOR = "div.border-black-borders"
+
+# Longest time (ms) to wait for the submarket rows to be rendered before reading the page.
+SUBMARKET_ROWS_WAIT_TIMEOUT = 2000
+
+# Only the submarket rows (and everything inside them) are built when parsing a market page.
+# The class attribute is not yet split into tokens while parsing, hence the whole-token pattern.
+SUBMARKET_ROW_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)border-black-borders(?:\s|$)"))
+
+# CSS selector of the odds values shown in a submarket row.
+ODDS_CONTAINER_SELECTOR = 'p[data-testid="odd-container-default"]'
+
+# CSS selector of the container holding a submarket name, for markets without a dedicated test id.
+SUBMARKET_NAME_SELECTOR = "div.flex.items-center.justify-start"
+
+# CSS selector of bold text, the last structural hint for a submarket name.
+BOLD_TEXT_SELECTOR = "p.font-bold"
+
+
+@lru_cache(maxsize=64)
+def _collapsed_option_box_pattern(main_market: str) -> re.Pattern:
+    """Return the `data-testid` pattern of a market's collapsed submarket rows, compiled once per market."""
+    market_key = main_market.lower().replace("/", "-").replace(" ", "-")
+    return re.compile(f"{market_key}-collapsed-option-box")
 
 
 class SubmarketExtractor:
@@ -31,35 +59,35 @@ class SubmarketExtractor:
             html_content = await page.content()
             if not isinstance(html_content, str):
                 html_content = ""
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, "lxml", parse_only=SUBMARKET_ROW_STRAINER)
 
             # Look for submarket containers
-            submarket_containers = soup.find_all("div", class_="border-black-borders")
+            submarket_containers = soup.select(SUBMARKET_ROW_SELECTOR)
 
             if submarket_containers:
                 visible_submarkets_count = len(submarket_containers)
                 self.logger.debug(f"Found {visible_submarkets_count} visible submarkets for {main_market}")
 
-                # Check if any of these submarkets have visible odds
-                submarkets_with_odds = 0
-                for container in submarket_containers[:5]:  # Check first 5 submarkets
-                    odds_containers = container.find_all("p", attrs={"data-testid": "odd-container-default"})
-                    if len(odds_containers) >= 2:  # Need at least 2 odds to be useful
-                        submarkets_with_odds += 1
+                # Check the first 5 submarkets for one with at least 2 visible odds, stopping at the first match
+                has_visible_odds = any(
+                    len(container.select(ODDS_CONTAINER_SELECTOR, limit=2)) >= 2
+                    for container in submarket_containers[:5]
+                )
 
-                self.logger.debug(f"Found {submarkets_with_odds} submarkets with visible odds for {main_market}")
+                self.logger.debug(f"Submarkets with visible odds found for {main_market}: {has_visible_odds}")
 
                 # If we have multiple visible submarkets with odds, the market is compatible
-                if visible_submarkets_count > 1 and submarkets_with_odds > 0:
+                if visible_submarkets_count > 1 and has_visible_odds:
                     self.logger.info(
                         f"Market {main_market} has {visible_submarkets_count} visible submarkets "
-                        f"({submarkets_with_odds} with odds) - compatible with preview mode"
+                        f"(with odds) - compatible with preview mode"
                     )
                     return True
                 else:
+                    odds_state = "with" if has_visible_odds else "without"
                     self.logger.info(
-                        f"Market {main_market} has {visible_submarkets_count} visible submarkets but only "
-                        f"{submarkets_with_odds} with odds - incompatible with preview mode"
+                        f"Market {main_market} has {visible_submarkets_count} visible submarkets "
+                        f"({odds_state} odds) - incompatible with preview mode"
                     )
                     return False
             else:
@@ -89,19 +117,33 @@ class SubmarketExtractor:
         self.logger.info(f"Extracting visible submarkets for {main_market} in passive mode")
 
         try:
-            await page.wait_for_timeout(2000)  # SCROLL_PAUSE_TIME
+            try:
+                await page.wait_for_selector(
+                    SUBMARKET_ROW_SELECTOR, state="attached", timeout=SUBMARKET_ROWS_WAIT_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                self.logger.debug("Submarket rows not rendered yet, reading the page as is.")
             html_content = await page.content()
             if not isinstance(html_content, str):
                 html_content = ""
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = BeautifulSoup(html_content, "lxml", parse_only=SUBMARKET_ROW_STRAINER)
 
             # Find all submarket rows (these contain the handicap names and odds)
-            submarket_rows = soup.find_all("div", class_=re.compile(r"border-black-borders"))
+            submarket_rows = soup.select(SUBMARKET_ROW_SELECTOR)
 
             if not submarket_rows:
                 self.logger.warning("No submarket rows found in passive mode")
                 return []
 
+            # Use provided odds_labels or determine based on market type
+            if odds_labels is None:
+                # Default to Over/Under labels, but adjust for single-odds markets
+                if "correct score" in main_market.lower():
+                    odds_labels = ["correct_score"]
+                else:
+                    odds_labels = ["odds_over", "odds_under"]
+            min_odds_required = len(odds_labels)
+
             submarkets_data = []
 
             for row in submarket_rows:
@@ -116,19 +158,7 @@ class SubmarketExtractor:
                     self.logger.debug(f"Extracted submarket name: '{submarket_name}'")
 
                     # Find all odds containers in this row
-                    odds_containers = row.find_all("p", attrs={"data-testid": "odd-container-default"})
-
-                    # Use provided odds_labels or determine based on market type
-                    if odds_labels is None:
-                        # Default to Over/Under labels, but adjust for single-odds markets
-                        if "correct score" in main_market.lower():
-                            odds_labels = ["correct_score"]
-                            min_odds_required = 1
-                        else:
-                            odds_labels = ["odds_over", "odds_under"]
-                            min_odds_required = 2
-                    else:
-                        min_odds_required = len(odds_labels)
+                    odds_containers = row.select(ODDS_CONTAINER_SELECTOR)
 
                     if len(odds_containers) < min_odds_required:
                         self.logger.debug(
@@ -137,12 +167,8 @@ class SubmarketExtractor:
                         )
                         continue
 
-                    # Extract odds values
-                    odds_values = []
-                    for container in odds_containers:
-                        odds_text = container.get_text(strip=True)
-                        if odds_text:
-                            odds_values.append(odds_text)
+                    # Extract the non-empty odds values
+                    odds_values = [text for container in odds_containers if (text := container.get_text(strip=True))]
 
                     if len(odds_values) >= min_odds_required:
                         submarket_data = {
@@ -178,9 +204,7 @@ class SubmarketExtractor:
     def _extract_submarket_name(self, row, main_market: str) -> str | None:
         """Extract submarket name from a row using multiple strategies."""
         # First, try to find the div with data-testid pattern (for Over/Under markets)
-        market_key = main_market.lower().replace("/", "-").replace(" ", "-")
-        data_testid_pattern = f"{market_key}-collapsed-option-box"
-        submarket_name_element = row.find("div", attrs={"data-testid": re.compile(data_testid_pattern)})
+        submarket_name_element = row.find("div", attrs={"data-testid": _collapsed_option_box_pattern(main_market)})
 
         if submarket_name_element:
             # For markets like Over/Under, look for the clean name in max-sm:!hidden class
@@ -194,7 +218,7 @@ class SubmarketExtractor:
                     return first_p.get_text(strip=True)
 
         # If not found, try to find any div with the flex classes (for other markets)
-        flex_div = row.find("div", class_=re.compile(r"flex.*items-center.*justify-start"))
+        flex_div = row.select_one(SUBMARKET_NAME_SELECTOR)
         if flex_div:
             # Look for the clean name in max-sm:!hidden class first
             clean_name_p = flex_div.find("p", class_="max-sm:!hidden")
@@ -207,7 +231,7 @@ class SubmarketExtractor:
                     return first_p.get_text(strip=True)
 
         # If still not found, try to find any <p> with font-bold class
-        bold_p = row.find("p", class_=re.compile(r"font-bold"))
+        bold_p = row.select_one(BOLD_TEXT_SELECTOR)
         if bold_p:
             return bold_p.get_text(strip=True)
 
@@ -215,15 +239,14 @@ class SubmarketExtractor:
         all_p_tags = row.find_all("p")
         for p_tag in all_p_tags:
             text = p_tag.get_text(strip=True)
-            # Skip percentage values, odds values, and other non-submarket text
+            # Correct Score submarkets contain ":", which already rules out odds values like "2.80";
+            # skip percentage values and other non-submarket text
             if (
-                text
-                and not text.endswith("%")
-                and not text.replace(".", "").isdigit()  # Skip pure numbers like "2.80"
+                ":" in text
                 and len(text) > 1
+                and not text.endswith("%")
                 and not text.startswith("data-testid")  # Skip any data attributes
-                and ":" in text
-            ):  # Correct Score submarkets contain ":"
+            ):
                 return text
 
         return None
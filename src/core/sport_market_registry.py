@@ -110,15 +110,21 @@ class SportMarketRegistrar:
     @staticmethod
     def create_market_lambda(main_market, specific_market=None, odds_labels=None):
         """
-        Creates a lambda function for market extraction.
+        Creates a function for market extraction.
+
+        The function is tagged with its `main_market` and `odds_labels`, so they can be read back without
+        calling it (see `MarketGrouping.get_main_market_info`).
         """
-        return (
-            lambda extractor,
+
+        def market_method(
+            extractor,
             page,
             period="FullTime",
             scrape_odds_history=False,  # Default to False for individual market extraction
             target_bookmaker=None,
-            preview_submarkets_only=False: extractor.extract_market_odds(
+            preview_submarkets_only=False,
+        ):
+            return extractor.extract_market_odds(
                 page=page,
                 main_market=main_market,
                 specific_market=specific_market,
@@ -128,7 +134,10 @@ class SportMarketRegistrar:
                 target_bookmaker=target_bookmaker,
                 preview_submarkets_only=preview_submarkets_only,
             )
-        )
+
+        market_method.main_market = main_market
+        market_method.odds_labels = odds_labels
+        return market_method
 
     @classmethod
     def register_football_markets(cls):
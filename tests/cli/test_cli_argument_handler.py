@@ -1,3 +1,4 @@
+import argparse
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -90,11 +91,42 @@ def test_parse_and_validate_args_valid(cli_handler):
         mock_validate_args.assert_called_once_with(mock_parse_args.return_value)
 
 
+def test_parse_and_validate_args_defaults_for_absent_arguments(cli_handler):
+    """Arguments missing from the namespace fall back to their defaults; present ones are kept."""
+    namespace = argparse.Namespace(
+        command="scrape_upcoming",
+        storage="local",
+        headless=False,
+        markets=None,
+        change_sensitivity="aggressive",
+    )
+
+    with (
+        patch.object(cli_handler.parser, "parse_args", return_value=namespace),
+        patch.object(cli_handler.validator, "validate_args"),
+    ):
+        parsed_args = cli_handler.parse_and_validate_args()
+
+    assert parsed_args["change_sensitivity"] == "aggressive"
+    assert parsed_args["scrape_odds_history"] is True
+    assert parsed_args["preview_submarkets_only"] is False
+    assert parsed_args["max_pages"] is None
+    assert parsed_args["storage_type"] == "local"
+
+
+def test_parser_shared_across_handler_instances():
+    with patch("sys.argv", ["cli_tool.py", "scrape_historic", "--sports", "football"]):
+        first = CLIArgumentHandler()
+        second = CLIArgumentHandler()
+
+    assert first.parser is second.parser
+    assert set(first.parser._subparsers._group_actions[0].choices) == {"scrape_historic"}
+
+
 def test_parse_and_validate_args_missing_command(cli_handler):
     with (
         patch("sys.argv", ["cli_tool.py"]),
         patch.object(cli_handler.parser, "print_help") as mock_print_help,
-        patch("builtins.exit"),
         patch("builtins.print"),
         patch.object(
             cli_handler.parser,
@@ -112,9 +144,11 @@ def test_parse_and_validate_args_missing_command(cli_handler):
             ),
         ),
     ):
-        cli_handler.parse_and_validate_args()
+        with pytest.raises(SystemExit) as exc_info:
+            cli_handler.parse_and_validate_args()
 
-        mock_print_help.assert_called()
+        assert exc_info.value.code == 1
+        mock_print_help.assert_not_called()
 
 
 def test_parse_and_validate_args_invalid_args(cli_handler):
@@ -122,7 +156,6 @@ def test_parse_and_validate_args_invalid_args(cli_handler):
         patch("sys.argv", ["cli_tool.py", "scrape", "--sports", "invalid-sport"]),
         patch.object(cli_handler.parser, "parse_args") as mock_parse_args,
         patch.object(cli_handler.validator, "validate_args") as mock_validate_args,
-        patch("builtins.exit") as mock_exit,
     ):
         mock_parse_args.return_value = MagicMock(
             command="scrape",
@@ -137,9 +170,10 @@ def test_parse_and_validate_args_invalid_args(cli_handler):
         )
         mock_validate_args.side_effect = ValueError("Invalid sport provided.")
 
-        cli_handler.parse_and_validate_args()
+        with pytest.raises(SystemExit) as exc_info:
+            cli_handler.parse_and_validate_args()
 
-        mock_exit.assert_called_once_with(1)
+        assert exc_info.value.code == 1
 
 
 def test_parse_and_validate_args_with_all_flag(cli_handler):
@@ -207,7 +241,6 @@ class TestAllFlagValidationFailureScenarios:
             patch("sys.argv", ["cli_tool.py", *mock_args]),
             patch.object(cli_handler.parser, "parse_args") as mock_parse_args,
             patch.object(cli_handler.validator, "validate_args") as mock_validate_args,
-            patch("builtins.exit") as mock_exit,
             patch("builtins.print") as mock_print,
         ):
             mock_parse_args.return_value = MagicMock(
@@ -236,11 +269,12 @@ class TestAllFlagValidationFailureScenarios:
             # Simulate validation failure for invalid sport
             mock_validate_args.side_effect = ValueError("Invalid sport: 'invalid_sport'. Supported sports are: [...]")
 
-            cli_handler.parse_and_validate_args()
+            with pytest.raises(SystemExit) as exc_info:
+                cli_handler.parse_and_validate_args()
 
             # Verify the handler properly handles validation failure
             mock_validate_args.assert_called_once_with(mock_parse_args.return_value)
-            mock_exit.assert_called_once_with(1)
+            assert exc_info.value.code == 1
 
             # Verify error message was printed
             mock_print.assert_called()
@@ -260,7 +294,6 @@ class TestAllFlagValidationFailureScenarios:
             patch("sys.argv", ["cli_tool.py", *mock_args]),
             patch.object(cli_handler.parser, "parse_args") as mock_parse_args,
             patch.object(cli_handler.validator, "validate_args") as mock_validate_args,
-            patch("builtins.exit") as mock_exit,
             patch("builtins.print") as mock_print,
         ):
             mock_parse_args.return_value = MagicMock(
@@ -289,11 +322,12 @@ class TestAllFlagValidationFailureScenarios:
             # Simulate validation failure for invalid storage
             mock_validate_args.side_effect = ValueError("Invalid storage type: 'invalid_storage'. Supported storage types are: [...]")
 
-            cli_handler.parse_and_validate_args()
+            with pytest.raises(SystemExit) as exc_info:
+                cli_handler.parse_and_validate_args()
 
             # Verify the handler properly handles validation failure
             mock_validate_args.assert_called_once_with(mock_parse_args.return_value)
-            mock_exit.assert_called_once_with(1)
+            assert exc_info.value.code == 1
 
             # Verify error message was printed
             mock_print.assert_called()
@@ -362,7 +396,6 @@ class TestAllFlagValidationFailureScenarios:
             patch("sys.argv", ["cli_tool.py", *mock_args]),
             patch.object(cli_handler.parser, "parse_args") as mock_parse_args,
             patch.object(cli_handler.validator, "validate_args") as mock_validate_args,
-            patch("builtins.exit") as mock_exit,
             patch("builtins.print") as mock_print,
         ):
             mock_parse_args.return_value = MagicMock(
@@ -394,11 +427,12 @@ class TestAllFlagValidationFailureScenarios:
                 "Invalid storage type: 'invalid_storage'."
             )
 
-            cli_handler.parse_and_validate_args()
+            with pytest.raises(SystemExit) as exc_info:
+                cli_handler.parse_and_validate_args()
 
             # Verify the handler properly handles validation failure
             mock_validate_args.assert_called_once_with(mock_parse_args.return_value)
-            mock_exit.assert_called_once_with(1)
+            assert exc_info.value.code == 1
 
             # Verify error messages were printed
             mock_print.assert_called()
@@ -555,7 +589,6 @@ class TestMarketsAllParameter:
             patch("sys.argv", ["cli_tool.py", *mock_args]),
             patch.object(cli_handler.parser, "parse_args") as mock_parse_args,
             patch.object(cli_handler.validator, "validate_args") as mock_validate_args,
-            patch("builtins.exit") as mock_exit,
             patch("builtins.print") as mock_print,
         ):
             mock_parse_args.return_value = MagicMock(
@@ -586,11 +619,12 @@ class TestMarketsAllParameter:
                 "Invalid storage type: 'invalid_storage'."
             )
 
-            cli_handler.parse_and_validate_args()
+            with pytest.raises(SystemExit) as exc_info:
+                cli_handler.parse_and_validate_args()
 
             # Verify validation was called and failed
             mock_validate_args.assert_called_once_with(mock_parse_args.return_value)
-            mock_exit.assert_called_once_with(1)
+            assert exc_info.value.code == 1
 
             # Verify error messages were printed
             mock_print.assert_called()
@@ -887,7 +921,6 @@ class TestLeaguesAllUpcomingMatchesParameter:
             patch("sys.argv", ["cli_tool.py", *mock_args]),
             patch.object(cli_handler.parser, "parse_args") as mock_parse_args,
             patch.object(cli_handler.validator, "validate_args") as mock_validate_args,
-            patch("builtins.exit") as mock_exit,
             patch("builtins.print") as mock_print,
         ):
             mock_parse_args.return_value = MagicMock(
@@ -918,11 +951,12 @@ class TestLeaguesAllUpcomingMatchesParameter:
                 "Invalid storage type: 'invalid_storage'."
             )
 
-            cli_handler.parse_and_validate_args()
+            with pytest.raises(SystemExit) as exc_info:
+                cli_handler.parse_and_validate_args()
 
             # Verify validation was called and failed
             mock_validate_args.assert_called_once_with(mock_parse_args.return_value)
-            mock_exit.assert_called_once_with(1)
+            assert exc_info.value.code == 1
 
             # Verify error messages were printed
             mock_print.assert_called()
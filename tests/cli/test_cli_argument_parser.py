@@ -14,6 +14,31 @@ def test_parser_has_subparsers(parser):
     assert "scrape_historic" in parser._subparsers._group_actions[0].choices
 
 
+@pytest.mark.parametrize(
+    ("argv", "expected_commands"),
+    [
+        (["scrape_upcoming", "--sports", "football"], {"scrape_upcoming"}),
+        (["scrape_historic", "--sports", "football"], {"scrape_historic"}),
+        (["scrape_historic", "--help"], {"scrape_upcoming", "scrape_historic"}),
+        (["-h"], {"scrape_upcoming", "scrape_historic"}),
+        ([], {"scrape_upcoming", "scrape_historic"}),
+    ],
+)
+def test_subparsers_built_lazily_from_argv(argv, expected_commands):
+    parser = CLIArgumentParser(argv=argv).get_parser()
+    assert set(parser._subparsers._group_actions[0].choices) == expected_commands
+
+
+def test_help_epilog_generated_only_when_help_is_formatted():
+    parser = CLIArgumentParser(argv=["scrape_upcoming"]).get_parser()
+    assert parser.epilog is None
+
+    help_text = parser.format_help()
+
+    assert "**Commands and Arguments**" in help_text
+    assert parser.epilog is not None
+
+
 def test_parse_scrape_upcoming(parser):
     args = parser.parse_args(
         [
@@ -275,8 +300,7 @@ def test_parse_leagues_with_spaces(parser):
             "1x2",
         ]
     )
-    # Note: Spaces will be handled by the validator, not the parser
-    assert args.leagues == ["england-premier-league", " spain-la-liga", " italy-serie-a"]
+    assert args.leagues == ["england-premier-league", "spain-la-liga", "italy-serie-a"]
 
 
 def test_parse_odds_format(parser):
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.cli.cli_argument_validator import CLIArgumentValidator
+from src.cli.cli_argument_parser import CLIArgumentParser
+from src.cli.cli_argument_validator import CLIArgumentValidator, _supported_markets
 from src.utils.sport_market_constants import Sport
 
 
@@ -57,14 +58,29 @@ def test_validate_command_invalid(validator, mock_args):
 def test_validate_sport_invalid(invalid_sport):
     validator = CLIArgumentValidator()
 
-    with pytest.raises(ValueError) as exc_info:
-        validator._validate_sport(sport=invalid_sport)
+    errors = validator._validate_sport(sport=invalid_sport)
 
     expected_sports = ", ".join(s.value for s in Sport)
-    if isinstance(invalid_sport, str):
-        assert f"Invalid sport: '{invalid_sport}'. Supported sports are: {expected_sports}." in str(exc_info.value)
+    if invalid_sport is None:
+        assert errors == [f"Invalid sports: None. Expected 'all' or one of {[s.value for s in Sport]}."]
+    elif isinstance(invalid_sport, str):
+        assert errors == [
+            f"Invalid sport: '{invalid_sport}'. Supported sports are: {expected_sports}, or 'all' for all sports."
+        ]
     else:
-        assert f"Invalid sport: {invalid_sport}. Expected one of {[s.value for s in Sport]}." in str(exc_info.value)
+        assert errors == [f"Invalid sport: {invalid_sport}. Expected 'all' or one of {[s.value for s in Sport]}."]
+
+
+def test_validate_args_reports_invalid_sport_with_other_errors(validator, mock_args):
+    mock_args.sports = "invalid_sport"
+    mock_args.storage = "invalid_storage"
+
+    with pytest.raises(ValueError) as exc_info:
+        validator.validate_args(mock_args)
+
+    messages = str(exc_info.value).splitlines()
+    assert sum(message.startswith("Invalid sport: 'invalid_sport'") for message in messages) == 1
+    assert any(message.startswith("Invalid storage type: 'invalid_storage'") for message in messages)
 
 
 def test_validate_sport_valid():
@@ -82,6 +98,29 @@ def test_validate_markets_invalid(validator, mock_args):
         validator.validate_args(mock_args)
 
 
+def test_validate_markets_looks_up_supported_markets_once_per_sport(validator):
+    _supported_markets.cache_clear()
+    with patch("src.cli.cli_argument_validator.get_supported_markets", return_value=["1x2", "btts"]) as mock_lookup:
+        assert validator._validate_markets(sport=Sport.FOOTBALL, markets=["1x2"]) == []
+        assert validator._validate_markets(sport=Sport.FOOTBALL, markets=["dnb"]) == [
+            "Invalid market: dnb. Supported markets for football: 1x2, btts."
+        ]
+    _supported_markets.cache_clear()
+
+    mock_lookup.assert_called_once_with(Sport.FOOTBALL)
+
+
+def test_validate_args_skips_arguments_of_other_commands(validator):
+    """Arguments of commands that were not requested are absent from args; their validators must not run."""
+    parser = CLIArgumentParser(argv=[]).get_parser()
+    args = parser.parse_args(["scrape_upcoming", "--sports", "football", "--markets", "1x2"])
+
+    with patch.object(validator, "_validate_max_pages") as mock_validate_max_pages:
+        validator.validate_args(args)
+
+    mock_validate_max_pages.assert_not_called()
+
+
 def test_validate_league_valid_after_dynamic_discovery(validator, mock_args):
     """Test that league validation passes since validation is now done during scraping."""
     mock_args.leagues = ["any_league_name"]  # Any league name should pass CLI validation
@@ -338,6 +377,14 @@ def test_parse_season_format_validation(validator):
         validator._parse_season("2022-2024")
 
 
+@pytest.mark.parametrize(
+    "season", ["202", "20233", "2022-", "-2023", "2022-20233", "2022_2023", "2022-2023-2024", "20a3"]
+)
+def test_parse_season_rejects_malformed_seasons(validator, season):
+    with pytest.raises(ValueError, match=f"Invalid season format: '{season}'"):
+        validator._parse_season(season)
+
+
 @pytest.mark.parametrize(
     ("proxies", "expected_errors"),
     [
@@ -367,6 +414,25 @@ def test_validate_proxies(validator, proxies, expected_errors):
     assert errors == expected_errors
 
 
+@pytest.mark.parametrize(
+    ("proxy", "is_valid"),
+    [
+        ("https://proxy-1.example.com:443", True),
+        ("socks4://10.0.0.1:1080 user pass", True),
+        ("ftp://proxy.com:21", False),
+        ("http://proxy.com", False),
+        ("http://:8080", False),
+        ("http://proxy.com:80a", False),
+        ("http://proxy.com:8080 user", False),
+        ("http://proxy.com:8080 user pass extra", False),
+        ("http://proxy.com:8080 ", False),
+        ("http://proxy:com:8080", False),
+    ],
+)
+def test_validate_proxies_structure(validator, proxy, is_valid):
+    assert (validator._validate_proxies(proxies=[proxy]) == []) is is_valid
+
+
 @pytest.mark.parametrize(
     ("user_agent", "locale_timezone", "timezone_id", "expected_errors"),
     [
@@ -406,6 +472,9 @@ def test_validate_browser_settings(validator, user_agent, locale_timezone, timez
             ["The '--sport' argument is required when using '--match_links'."],
         ),
         (["invalid_url_format"], "football", ["Invalid match link format: invalid_url_format"]),
+        (["http://www.oddsportal.com/football/match/123456"], "football", []),
+        (["https://www.oddsportal.com/"], "football", ["Invalid match link format: https://www.oddsportal.com/"]),
+        (["ftp://www.oddsportal.com/match"], "football", ["Invalid match link format: ftp://www.oddsportal.com/match"]),
     ],
 )
 def test_validate_match_links(validator, match_links, sport, expected_errors):
@@ -445,6 +514,19 @@ def test_validate_file_args_no_extension(validator):
     assert "File path 'data_file' must include a valid file extension" in errors[0]
 
 
+def test_validate_file_args_ignores_dots_in_directory_names(validator):
+    args = MagicMock(file_path="exports.v2/data_file", format=None)
+    errors = validator._validate_file_args(args=args)
+    assert len(errors) == 1
+    assert "must include a valid file extension" in errors[0]
+
+
+def test_validate_file_args_extension_sets_format(validator):
+    args = MagicMock(file_path="exports.v2/data.CSV", format=None)
+    validator._validate_file_args(args=args)
+    assert args.format == "csv"
+
+
 def test_validate_file_args_format_only(validator):
     args = MagicMock(file_path=None, format="json")
     errors = validator._validate_file_args(args=args)
@@ -1,10 +1,12 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from playwright.async_api import Page, TimeoutError
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 
-from src.core.base_scraper import BaseScraper
+from src.core.base_scraper import EVENT_HEADER_DATA_SCRIPT, EVENT_ROW_LINKS_SELECTOR, BaseScraper
 from src.core.browser_helper import BrowserHelper
 from src.core.odds_portal_market_extractor import OddsPortalMarketExtractor
 from src.core.playwright_manager import PlaywrightManager
@@ -28,6 +30,8 @@ def setup_base_scraper_mocks():
     page_mock.query_selector_all = AsyncMock()
     page_mock.content = AsyncMock(return_value="<html><body>Test HTML</body></html>")
     page_mock.wait_for_timeout = AsyncMock()
+    page_mock.evaluate = AsyncMock(return_value=None)
+    page_mock.is_closed = MagicMock(return_value=False)
 
     # Configure the context mock
     context_mock = AsyncMock()
@@ -96,29 +100,32 @@ async def test_set_odds_format(setup_base_scraper_mocks):
     page_mock.query_selector_all.assert_called_once()
     format_option1.inner_text.assert_called_once()
     format_option1.click.assert_called_once()
+    page_mock.wait_for_function.assert_awaited_once()
+    page_mock.wait_for_timeout.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_set_odds_format_timeout(setup_base_scraper_mocks):
+async def test_set_odds_format_timeout(setup_base_scraper_mocks, caplog):
     """Test handling timeout when setting odds format."""
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
     page_mock = mocks["page_mock"]
 
-    # Mock a timeout error
-    page_mock.wait_for_selector.side_effect = TimeoutError("Timeout")
+    # Mock a Playwright timeout error
+    page_mock.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
 
     # Test handling the timeout
     await scraper.set_odds_format(page=page_mock)
 
     page_mock.wait_for_selector.assert_called_once()
     page_mock.query_selector.assert_not_called()
+    assert "Timeout while setting odds format" in caplog.text
+    assert "Error while setting odds format" not in caplog.text
 
 
 @pytest.mark.asyncio
 @patch("src.core.base_scraper.BeautifulSoup")
-@patch("src.core.base_scraper.re")
-async def test_extract_match_links(re_mock, bs4_mock, setup_base_scraper_mocks):
+async def test_extract_match_links(bs4_mock, setup_base_scraper_mocks):
     """Test extracting match links from a page."""
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
@@ -128,22 +135,12 @@ async def test_extract_match_links(re_mock, bs4_mock, setup_base_scraper_mocks):
     soup_mock = MagicMock()
     bs4_mock.return_value = soup_mock
 
-    # Mock regex compile
-    pattern_mock = MagicMock()
-    re_mock.compile.return_value = pattern_mock
-
-    # Mock finding event rows and links
-    event_row1 = MagicMock()
-    event_row2 = MagicMock()
-
+    # Mock finding links in event rows
     link1 = {"href": "/football/england/premier-league/arsenal-chelsea/abcd1234"}
     link2 = {"href": "/football/england/premier-league/liverpool-man-utd/efgh5678"}
     link3 = {"href": "/"}  # Should be filtered out
 
-    event_row1.find_all.return_value = [link1, link3]
-    event_row2.find_all.return_value = [link2]
-
-    soup_mock.find_all.return_value = [event_row1, event_row2]
+    soup_mock.select.return_value = [link1, link3, link2]
 
     # Call the method under test
     result = await scraper.extract_match_links(page=page_mock)
@@ -151,8 +148,7 @@ async def test_extract_match_links(re_mock, bs4_mock, setup_base_scraper_mocks):
     # Verify interactions
     page_mock.content.assert_called_once()
     bs4_mock.assert_called_once()
-    re_mock.compile.assert_called_once_with("^eventRow")
-    soup_mock.find_all.assert_called_once_with(class_=pattern_mock)
+    soup_mock.select.assert_called_once_with(EVENT_ROW_LINKS_SELECTOR)
 
     # Verify results
     expected_links = [
@@ -162,6 +158,26 @@ async def test_extract_match_links(re_mock, bs4_mock, setup_base_scraper_mocks):
     assert sorted(result) == sorted(expected_links)
 
 
+@pytest.mark.asyncio
+async def test_extract_match_links_matches_event_row_class_prefix(setup_base_scraper_mocks):
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    page_mock = mocks["page_mock"]
+    page_mock.content.return_value = (
+        '<div class="group eventRow flex"><a href="/football/england/premier-league/arsenal-chelsea/abcd1234/">x</a>'
+        "</div>"
+        '<div class="eventRowLink"><a href="/football/spain/laliga/real-barca/efgh5678/">y</a></div>'
+        '<div class="notAnEventRow"><a href="/football/italy/serie-a/inter-milan/ijkl9012/">z</a></div>'
+    )
+
+    result = await scraper.extract_match_links(page=page_mock)
+
+    assert sorted(result) == [
+        f"{ODDSPORTAL_BASE_URL}/football/england/premier-league/arsenal-chelsea/abcd1234/",
+        f"{ODDSPORTAL_BASE_URL}/football/spain/laliga/real-barca/efgh5678/",
+    ]
+
+
 @pytest.mark.asyncio
 @patch("src.core.base_scraper.BeautifulSoup")
 async def test_extract_match_links_error(bs4_mock, setup_base_scraper_mocks):
@@ -209,8 +225,9 @@ async def test_extract_match_odds(setup_base_scraper_mocks):
             sport="football", match_links=match_links, markets=["1x2"], scrape_odds_history=False
         )
 
-    # Verify new_page was called for each match link
-    assert context_mock.new_page.call_count == 2
+    # Verify the worker reused one tab for both match links
+    context_mock.new_page.assert_called_once()
+    context_mock.new_page.return_value.close.assert_called_once()
 
     # Verify the result
     assert len(result) == 2
@@ -218,6 +235,78 @@ async def test_extract_match_odds(setup_base_scraper_mocks):
     assert {"match": "data2"} in result
 
 
+@pytest.mark.asyncio
+async def test_extract_match_odds_bounds_concurrency_and_keeps_order(setup_base_scraper_mocks):
+    """At most `concurrent_scraping_task` links are scraped at once; results follow the input order."""
+    scraper = setup_base_scraper_mocks["scraper"]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def scrape_match_data(page, match_link, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 if match_link.endswith("0") else 0)
+        in_flight -= 1
+        if match_link.endswith("3"):
+            raise RuntimeError("boom")
+        return {"match": match_link}
+
+    scraper._scrape_match_data = scrape_match_data
+    match_links = [f"https://oddsportal.com/match{i}" for i in range(6)]
+
+    result = await scraper.extract_match_odds(sport="football", match_links=match_links, concurrent_scraping_task=2)
+
+    assert max_in_flight == 2
+    assert result == [{"match": link} for link in match_links if not link.endswith("3")]
+    # One tab per worker, plus a replacement for the tab that failed.
+    assert setup_base_scraper_mocks["context_mock"].new_page.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_replaces_tab_after_failed_scrape(setup_base_scraper_mocks):
+    """A link whose scrape returns None counts as failed, and the next link gets a new tab."""
+    scraper = setup_base_scraper_mocks["scraper"]
+    context_mock = setup_base_scraper_mocks["context_mock"]
+    first_tab, second_tab = AsyncMock(), AsyncMock()
+    first_tab.is_closed = MagicMock(return_value=False)
+    second_tab.is_closed = MagicMock(return_value=False)
+    context_mock.new_page = AsyncMock(side_effect=[first_tab, second_tab])
+    scraper._scrape_match_data = AsyncMock(side_effect=[None, {"match": "data2"}])
+
+    result = await scraper.extract_match_odds(
+        sport="football",
+        match_links=["https://oddsportal.com/match1", "https://oddsportal.com/match2"],
+        concurrent_scraping_task=1,
+    )
+
+    assert result == [{"match": "data2"}]
+    assert [call.kwargs["page"] for call in scraper._scrape_match_data.await_args_list] == [first_tab, second_tab]
+    first_tab.close.assert_awaited_once()
+    second_tab.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_extract_match_odds_replaces_closed_tab(setup_base_scraper_mocks):
+    """A tab that was closed underneath the worker is not reused for the next link."""
+    scraper = setup_base_scraper_mocks["scraper"]
+    context_mock = setup_base_scraper_mocks["context_mock"]
+    first_tab, second_tab = AsyncMock(), AsyncMock()
+    first_tab.is_closed = MagicMock(return_value=True)
+    second_tab.is_closed = MagicMock(return_value=False)
+    context_mock.new_page = AsyncMock(side_effect=[first_tab, second_tab])
+    scraper._scrape_match_data = AsyncMock(side_effect=[{"match": "data1"}, {"match": "data2"}])
+
+    result = await scraper.extract_match_odds(
+        sport="football",
+        match_links=["https://oddsportal.com/match1", "https://oddsportal.com/match2"],
+        concurrent_scraping_task=1,
+    )
+
+    assert result == [{"match": "data1"}, {"match": "data2"}]
+    assert [call.kwargs["page"] for call in scraper._scrape_match_data.await_args_list] == [first_tab, second_tab]
+
+
 @pytest.mark.asyncio
 async def test_scrape_match_data(setup_base_scraper_mocks):
     """Test scraping data for a specific match."""
@@ -304,27 +393,20 @@ async def test_scrape_match_data_no_details(setup_base_scraper_mocks):
 
 
 @pytest.mark.asyncio
-@patch("src.core.base_scraper.BeautifulSoup")
 @patch("src.core.base_scraper.json")
-async def test_extract_match_details_event_header(json_mock, bs4_mock, setup_base_scraper_mocks):
+async def test_extract_match_details_event_header(json_mock, setup_base_scraper_mocks):
     """Test extracting match details from the react event header."""
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
     page_mock = mocks["page_mock"]
 
-    # Mock BeautifulSoup and its find method
-    soup_mock = MagicMock()
-    bs4_mock.return_value = soup_mock
-
-    # Mock the div with event header data
-    event_header_div = MagicMock()
-    event_header_div.__getitem__.return_value = (
+    # Mock the event header's data attribute, read in the browser
+    page_mock.evaluate.return_value = (
         '{"eventBody": {"startDate": 1681753200, "homeResult": 2, "awayResult": 1, '
         '"partialresult": "1-0", "venue": "Emirates Stadium", "venueTown": "London", '
         '"venueCountry": "England"}, "eventData": {"home": "Arsenal", "away": "Chelsea", '
         '"tournamentName": "Premier League"}}'
     )
-    soup_mock.find.return_value = event_header_div
 
     # Mock JSON parsing
     parsed_data = {
@@ -344,11 +426,10 @@ async def test_extract_match_details_event_header(json_mock, bs4_mock, setup_bas
     # Call the method under test
     result = await scraper._extract_match_details_event_header(page=page_mock)
 
-    # Verify interactions
-    page_mock.content.assert_called_once()
-    bs4_mock.assert_called_once_with(page_mock.content.return_value, "html.parser")
-    soup_mock.find.assert_called_once_with("div", id="react-event-header")
-    json_mock.loads.assert_called_once()
+    # Verify interactions: only the attribute crosses over from the browser, the page is not serialized
+    page_mock.evaluate.assert_awaited_once_with(EVENT_HEADER_DATA_SCRIPT)
+    page_mock.content.assert_not_called()
+    json_mock.loads.assert_called_once_with(page_mock.evaluate.return_value)
 
     # Verify the result has expected fields
     assert result["home_team"] == "Arsenal"
@@ -365,42 +446,54 @@ async def test_extract_match_details_event_header(json_mock, bs4_mock, setup_bas
 
 
 @pytest.mark.asyncio
-@patch("src.core.base_scraper.BeautifulSoup")
-async def test_extract_match_details_missing_div(bs4_mock, setup_base_scraper_mocks):
+async def test_extract_match_details_strips_non_ascii_venue_town(setup_base_scraper_mocks):
+    """Missing fields default to None and non-ASCII letters are dropped from the venue town."""
+    mocks = setup_base_scraper_mocks
+    scraper = mocks["scraper"]
+    page_mock = mocks["page_mock"]
+    page_mock.evaluate.return_value = (
+        '{"eventBody": {"homeResult": 2, "venue": "Stade & Arena", "venueTown": "Décines"}, '
+        '"eventData": {"home": "Lyon", "away": "Nice"}}'
+    )
+
+    result = await scraper._extract_match_details_event_header(page=page_mock)
+
+    assert result["home_team"] == "Lyon"
+    assert result["away_team"] == "Nice"
+    assert result["home_score"] == 2
+    assert result["venue"] == "Stade & Arena"
+    assert result["venue_town"] == "Dcines"
+    assert result["match_date"] is None
+
+
+@pytest.mark.asyncio
+async def test_extract_match_details_missing_div(setup_base_scraper_mocks):
     """Test extracting match details when the header div is missing."""
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
     page_mock = mocks["page_mock"]
 
-    # Mock BeautifulSoup and its find method returning None
-    soup_mock = MagicMock()
-    bs4_mock.return_value = soup_mock
-    soup_mock.find.return_value = None
+    # The header lookup in the page finds no div (or no data attribute)
+    page_mock.evaluate.return_value = None
 
     # Call the method under test
     result = await scraper._extract_match_details_event_header(page=page_mock)
 
-    # Verify result is None when the div is missing
+    # Verify result is None when the div is missing, without falling back to serializing the page
     assert result is None
+    page_mock.content.assert_not_called()
 
 
 @pytest.mark.asyncio
-@patch("src.core.base_scraper.BeautifulSoup")
 @patch("src.core.base_scraper.json")
-async def test_extract_match_details_invalid_json(json_mock, bs4_mock, setup_base_scraper_mocks):
+async def test_extract_match_details_invalid_json(json_mock, setup_base_scraper_mocks):
     """Test extracting match details with invalid JSON data."""
     mocks = setup_base_scraper_mocks
     scraper = mocks["scraper"]
     page_mock = mocks["page_mock"]
 
-    # Mock BeautifulSoup and its find method
-    soup_mock = MagicMock()
-    bs4_mock.return_value = soup_mock
-
-    # Mock the div with invalid data
-    event_header_div = MagicMock()
-    event_header_div.__getitem__.return_value = "invalid JSON"
-    soup_mock.find.return_value = event_header_div
+    # Mock the header with invalid data
+    page_mock.evaluate.return_value = "invalid JSON"
 
     # Mock JSON parsing error
     json_mock.loads.side_effect = json.JSONDecodeError("Invalid JSON", "invalid JSON", 0)
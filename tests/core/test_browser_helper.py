@@ -1,9 +1,36 @@
+import asyncio
+import gc
 import logging
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 
-from src.core.browser_helper import BrowserHelper
+from src.core.browser_helper import (
+    ACTIVE_TAB_SELECTORS,
+    FIRST_MATCH_TEXTS_SCRIPT,
+    MORE_BUTTON_TEXT_PATTERN,
+    PAGE_MENTIONS_TEXT_SCRIPT,
+    SCROLL_AND_MEASURE_SCRIPT,
+    SCROLL_STEP_SCRIPT,
+    BrowserHelper,
+)
+from src.core.odds_portal_selectors import OddsPortalSelectors
+
+
+def mock_text_locator(page, count=1):
+    """Mock `page.locator(...)` chains, returning the chained locator and the element it resolves to."""
+    locator = MagicMock()
+    locator.filter.return_value = locator
+    locator.locator.return_value = locator
+    element = MagicMock()
+    element.count = AsyncMock(return_value=count)
+    element.click = AsyncMock()
+    element.scroll_into_view_if_needed = AsyncMock()
+    element.locator.return_value.click = AsyncMock()
+    locator.first = element
+    page.locator = MagicMock(return_value=locator)
+    return locator, element
 
 
 class TestBrowserHelper:
@@ -18,6 +45,8 @@ class TestBrowserHelper:
     def mock_page(self):
         """Create a mock Playwright page."""
         page = AsyncMock()
+        page.url = "https://www.oddsportal.com/football/"
+        page.locator = MagicMock()  # Locators are built synchronously
         return page
 
     # =============================================================================
@@ -47,6 +76,47 @@ class TestBrowserHelper:
         assert result is True
         mock_page.wait_for_selector.assert_called_with(custom_selector, timeout=10000)
 
+    @pytest.mark.asyncio
+    async def test_dismiss_cookie_banner_remembered_per_site(self, browser_helper, mock_page):
+        """Test that a dismissed banner is not waited for again on the same site and browser context."""
+        mock_page.wait_for_selector = AsyncMock()
+        mock_page.click = AsyncMock()
+
+        assert await browser_helper.dismiss_cookie_banner(mock_page) is True
+        mock_page.url = "https://www.oddsportal.com/football/england/premier-league/"
+        assert await browser_helper.dismiss_cookie_banner(mock_page) is True
+
+        mock_page.wait_for_selector.assert_called_once()
+        mock_page.click.assert_called_once()
+
+        # A new browser context starts without the consent cookie
+        mock_page.context = MagicMock()
+        assert await browser_helper.dismiss_cookie_banner(mock_page) is True
+        assert mock_page.wait_for_selector.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dismiss_cookie_banner_does_not_keep_contexts_alive(self, browser_helper, mock_page):
+        """Test that remembering a dismissed banner does not keep its browser context alive."""
+        mock_page.wait_for_selector = AsyncMock()
+        mock_page.click = AsyncMock()
+        mock_page.context = MagicMock()
+
+        assert await browser_helper.dismiss_cookie_banner(mock_page) is True
+        assert len(browser_helper._dismissed_cookie_banners) == 1
+
+        mock_page.context = MagicMock()
+        gc.collect()
+        assert len(browser_helper._dismissed_cookie_banners) == 0
+
+    @pytest.mark.asyncio
+    async def test_dismiss_cookie_banner_not_remembered_when_missing(self, browser_helper, mock_page):
+        """Test that a banner that was not found is looked for again on the next call."""
+        mock_page.wait_for_selector.side_effect = [TimeoutError("Timeout"), None]
+
+        assert await browser_helper.dismiss_cookie_banner(mock_page) is False
+        assert await browser_helper.dismiss_cookie_banner(mock_page) is True
+        assert mock_page.wait_for_selector.call_count == 2
+
     @pytest.mark.asyncio
     async def test_dismiss_cookie_banner_timeout_error(self, browser_helper, mock_page):
         """Test cookie banner dismissal when banner is not found (timeout)."""
@@ -99,6 +169,19 @@ class TestBrowserHelper:
             result = await browser_helper.navigate_to_market_tab(mock_page, "Draw No Bet")
             assert result is True
 
+    @pytest.mark.asyncio
+    async def test_navigate_to_market_tab_skips_verification_by_default(self, browser_helper, mock_page):
+        """Test that a successful click is trusted without checking the active tab."""
+        with (
+            patch.object(browser_helper, "_wait_and_click", return_value=True),
+            patch.object(browser_helper, "_verify_tab_is_active", return_value=False) as mock_verify,
+            patch.object(browser_helper, "_click_more_if_market_hidden", return_value=False) as mock_more,
+        ):
+            result = await browser_helper.navigate_to_market_tab(mock_page, "Draw No Bet")
+            assert result is True
+            mock_verify.assert_not_called()
+            mock_more.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_navigate_to_market_tab_clicked_but_not_active(self, browser_helper, mock_page):
         """Test market tab navigation when clicked but not active."""
@@ -107,7 +190,7 @@ class TestBrowserHelper:
             patch.object(browser_helper, "_verify_tab_is_active", return_value=False),
             patch.object(browser_helper, "_click_more_if_market_hidden", return_value=False),
         ):
-            result = await browser_helper.navigate_to_market_tab(mock_page, "Draw No Bet")
+            result = await browser_helper.navigate_to_market_tab(mock_page, "Draw No Bet", verify=True)
             assert result is False
 
     @pytest.mark.asyncio
@@ -128,7 +211,7 @@ class TestBrowserHelper:
             patch.object(browser_helper, "_click_more_if_market_hidden", return_value=True),
             patch.object(browser_helper, "_verify_tab_is_active", return_value=False),
         ):
-            result = await browser_helper.navigate_to_market_tab(mock_page, "Draw No Bet")
+            result = await browser_helper.navigate_to_market_tab(mock_page, "Draw No Bet", verify=True)
             assert result is False
 
     # =============================================================================
@@ -139,20 +222,22 @@ class TestBrowserHelper:
     async def test_scroll_until_loaded_success_with_selector(self, browser_helper, mock_page):
         """Test successful scrolling with content selector."""
         # Mock page evaluation and element counting
-        mock_page.evaluate.return_value = 1000  # Same height for all calls
-        mock_page.query_selector_all.return_value = [AsyncMock()] * 5  # 5 elements
+        mock_page.evaluate.return_value = [1000, 5]  # Same height and 5 elements for all calls
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_loaded(
             mock_page, timeout=1, scroll_pause_time=0.1, max_scroll_attempts=2, content_check_selector=".test-element"
         )
         assert result is True
+        mock_page.evaluate.assert_awaited_with(SCROLL_AND_MEASURE_SCRIPT, ".test-element")
+        assert mock_page.evaluate.await_count == 3  # One round-trip per iteration
+        mock_page.query_selector_all.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_scroll_until_loaded_success_height_based(self, browser_helper, mock_page):
         """Test successful scrolling with height-based detection."""
         # Mock page evaluation with changing height then stable
-        mock_page.evaluate.return_value = 1200  # Stable height
+        mock_page.evaluate.return_value = [1200, 0]  # Stable height
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_loaded(
@@ -164,16 +249,15 @@ class TestBrowserHelper:
     async def test_scroll_until_loaded_timeout(self, browser_helper, mock_page):
         """Test scrolling that times out."""
         # Mock page evaluation with changing height (never stabilizes)
-        mock_page.evaluate.return_value = 1000  # Stable height but short timeout
+        mock_page.evaluate.return_value = [1000, 0]  # Stable height but short timeout
         mock_page.wait_for_timeout = AsyncMock()
 
         # Mock a longer wait time to ensure timeout is reached
         async def slow_wait(*args, **kwargs):
-            import asyncio
-
             await asyncio.sleep(0.1)  # Simulate slow operation
 
         mock_page.wait_for_timeout = slow_wait
+        mock_page.wait_for_function = slow_wait
 
         result = await browser_helper.scroll_until_loaded(
             mock_page,
@@ -182,97 +266,117 @@ class TestBrowserHelper:
         )
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_scroll_until_loaded_waits_full_pause_per_stable_attempt(self, browser_helper, mock_page):
+        """Test that every stable attempt waits the full pause for new content, even after the page grew."""
+        heights = [1000, 1000, 1500, 1500, 1500, 1500]
+        mock_page.evaluate.side_effect = [[height, 0] for height in heights]
+        mock_page.wait_for_function.side_effect = PlaywrightTimeoutError("Timeout")
+
+        result = await browser_helper.scroll_until_loaded(
+            mock_page, timeout=5, scroll_pause_time=0.6, max_scroll_attempts=3
+        )
+
+        assert result is True
+        calls = mock_page.wait_for_function.await_args_list
+        assert [call.kwargs["timeout"] for call in calls] == [600] * 5
+        assert [call.kwargs["arg"] for call in calls] == [1000, 1000, 1500, 1500, 1500]
+        mock_page.wait_for_timeout.assert_not_awaited()
+        mock_page.wait_for_load_state.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_scroll_until_loaded_with_changing_content(self, browser_helper, mock_page):
         """Test scrolling with content that keeps changing."""
         # Mock page evaluation and changing element count
-        mock_page.evaluate.return_value = 1000  # Same height
-        mock_page.query_selector_all.return_value = [AsyncMock()] * 7  # 7 elements (stable)
+        mock_page.evaluate.side_effect = [[1000, 5], [1000, 7], [1000, 7], [1000, 7]]  # Grows to 7 elements
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_loaded(
             mock_page, timeout=1, scroll_pause_time=0.1, max_scroll_attempts=2, content_check_selector=".test-element"
         )
         assert result is True
+        assert mock_page.evaluate.await_count == 4
 
     @pytest.mark.asyncio
     async def test_scroll_until_visible_and_click_parent_success_with_text(self, browser_helper, mock_page):
         """Test successful scroll and click with text matching."""
-        # Mock element with matching text and bounding box
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = "Target Text"
-        mock_element.bounding_box.return_value = {"x": 0, "y": 0, "width": 100, "height": 50}
-        mock_element.evaluate_handle.return_value = AsyncMock()
-
-        mock_page.query_selector_all.return_value = [mock_element]
-        mock_page.evaluate = AsyncMock()
+        locator, element = mock_text_locator(mock_page, count=1)
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_visible_and_click_parent(
             mock_page, "test-selector", "Target Text", timeout=1, scroll_pause_time=0.1
         )
         assert result is True
+        mock_page.locator.assert_called_once_with("test-selector")
+        pattern = locator.filter.call_args.kwargs["has_text"]
+        assert pattern.search("Some Target Text here")
+        assert not pattern.search("some target text")
+        locator.locator.assert_called_once_with("visible=true")
+        element.scroll_into_view_if_needed.assert_awaited_once_with(timeout=100)
+        element.locator.assert_called_once_with("xpath=..")
+        element.locator.return_value.click.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_scroll_until_visible_and_click_parent_success_without_text(self, browser_helper, mock_page):
         """Test successful scroll and click without text matching."""
-        # Mock element with bounding box
-        mock_element = AsyncMock()
-        mock_element.bounding_box.return_value = {"x": 0, "y": 0, "width": 100, "height": 50}
-        mock_element.evaluate_handle.return_value = AsyncMock()
-
-        mock_page.query_selector_all.return_value = [mock_element]
-        mock_page.evaluate = AsyncMock()
+        locator, element = mock_text_locator(mock_page, count=1)
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_visible_and_click_parent(
             mock_page, "test-selector", timeout=1, scroll_pause_time=0.1
         )
         assert result is True
+        locator.filter.assert_not_called()
+        element.locator.return_value.click.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_scroll_until_visible_and_click_parent_no_bounding_box(self, browser_helper, mock_page):
-        """Test scroll and click when element has no bounding box."""
-        # Mock element without bounding box
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = "Target Text"
-        mock_element.bounding_box.return_value = None
-
-        mock_page.query_selector_all.return_value = [mock_element]
-        mock_page.evaluate = AsyncMock()
-        mock_page.wait_for_timeout = AsyncMock()
+    async def test_scroll_until_visible_and_click_parent_scrolls_until_rendered(self, browser_helper, mock_page):
+        """Test that the page is scrolled a step each time the element is not rendered within the pause."""
+        _, element = mock_text_locator(mock_page, count=1)
+        element.scroll_into_view_if_needed.side_effect = [
+            PlaywrightTimeoutError("Timeout"),
+            PlaywrightTimeoutError("Timeout"),
+            None,
+        ]
 
         result = await browser_helper.scroll_until_visible_and_click_parent(
-            mock_page, "test-selector", "Target Text", timeout=1, scroll_pause_time=0.1
+            mock_page, "test-selector", "Target Text", timeout=5, scroll_pause_time=0.1
         )
-        assert result is False
+
+        assert result is True
+        assert element.scroll_into_view_if_needed.await_args_list == [call(timeout=100)] * 3
+        assert mock_page.evaluate.await_args_list == [call(SCROLL_STEP_SCRIPT)] * 2
+        element.locator.return_value.click.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_scroll_until_visible_and_click_parent_timeout(self, browser_helper, mock_page):
         """Test scroll and click that times out."""
-        # Mock no elements found
-        mock_page.query_selector_all.return_value = []
-        mock_page.evaluate = AsyncMock()
-        mock_page.wait_for_timeout = AsyncMock()
+        # Mock no visible element with the text showing up in time
+        _, element = mock_text_locator(mock_page)
+
+        async def not_rendered(timeout):
+            await asyncio.sleep(timeout / 1000)
+            raise PlaywrightTimeoutError("Timeout")
+
+        element.scroll_into_view_if_needed.side_effect = not_rendered
 
         result = await browser_helper.scroll_until_visible_and_click_parent(
-            mock_page, "test-selector", "Target Text", timeout=0.1, scroll_pause_time=0.1
+            mock_page, "test-selector", "Target Text", timeout=0.1, scroll_pause_time=0.05
         )
         assert result is False
+        assert all(c.kwargs["timeout"] <= 50 for c in element.scroll_into_view_if_needed.await_args_list)
+        mock_page.evaluate.assert_awaited_with(SCROLL_STEP_SCRIPT)
+        element.locator.assert_not_called()
+        mock_page.wait_for_timeout.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_scroll_until_visible_and_click_parent_text_not_found(self, browser_helper, mock_page):
-        """Test scroll and click when text is not found."""
-        # Mock element with different text
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = "Different Text"
-
-        mock_page.query_selector_all.return_value = [mock_element]
-        mock_page.evaluate = AsyncMock()
-        mock_page.wait_for_timeout = AsyncMock()
+    async def test_scroll_until_visible_and_click_parent_click_error(self, browser_helper, mock_page):
+        """Test scroll and click when clicking the parent fails."""
+        _, element = mock_text_locator(mock_page, count=1)
+        element.locator.return_value.click.side_effect = Exception("Click failed")
 
         result = await browser_helper.scroll_until_visible_and_click_parent(
-            mock_page, "test-selector", "Target Text", timeout=0.1, scroll_pause_time=0.1
+            mock_page, "test-selector", "Target Text", timeout=1, scroll_pause_time=0.1
         )
         assert result is False
 
@@ -310,57 +414,50 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_click_by_text_success(self, browser_helper, mock_page):
         """Test successful click by text."""
-        # Mock element with matching text
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = "Target Text"
-
-        mock_page.query_selector_all.return_value = [mock_element]
+        locator, element = mock_text_locator(mock_page, count=1)
 
         result = await browser_helper._click_by_text(mock_page, "test-selector", "Target")
         assert result is True
-        mock_element.click.assert_called_once()
+        mock_page.locator.assert_called_once_with("test-selector")
+        pattern = locator.filter.call_args.kwargs["has_text"]
+        assert pattern.search("Target Text")
+        assert not pattern.search("target text")
+        element.click.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_click_by_text_no_match(self, browser_helper, mock_page):
-        """Test click by text when no match is found."""
-        # Mock element with different text
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = "Different Text"
+    async def test_click_by_text_escapes_text(self, browser_helper, mock_page):
+        """Test that the text is matched literally, not as a pattern."""
+        locator, _ = mock_text_locator(mock_page, count=1)
 
-        mock_page.query_selector_all.return_value = [mock_element]
+        await browser_helper._click_by_text(mock_page, "test-selector", "Over/Under +2.5")
 
-        result = await browser_helper._click_by_text(mock_page, "test-selector", "Target")
-        assert result is False
+        pattern = locator.filter.call_args.kwargs["has_text"]
+        assert pattern.search("Over/Under +2.5")
+        assert not pattern.search("Over/Under 2x5")
 
     @pytest.mark.asyncio
-    async def test_click_by_text_empty_text(self, browser_helper, mock_page):
-        """Test click by text when element text is empty."""
-        # Mock element with empty text
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = ""
-
-        mock_page.query_selector_all.return_value = [mock_element]
+    async def test_click_by_text_no_match(self, browser_helper, mock_page):
+        """Test click by text when no match is found."""
+        _, element = mock_text_locator(mock_page, count=0)
 
         result = await browser_helper._click_by_text(mock_page, "test-selector", "Target")
         assert result is False
+        element.click.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_click_by_text_click_error(self, browser_helper, mock_page):
         """Test click by text when click fails."""
-        # Mock element with matching text but click fails
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = "Target Text"
-        mock_element.click.side_effect = Exception("Click failed")
-
-        mock_page.query_selector_all.return_value = [mock_element]
+        _, element = mock_text_locator(mock_page, count=1)
+        element.click.side_effect = Exception("Click failed")
 
         result = await browser_helper._click_by_text(mock_page, "test-selector", "Target")
         assert result is False
 
     @pytest.mark.asyncio
     async def test_click_by_text_query_error(self, browser_helper, mock_page):
-        """Test click by text when query_selector_all fails."""
-        mock_page.query_selector_all.side_effect = Exception("Query failed")
+        """Test click by text when counting the matches fails."""
+        _, element = mock_text_locator(mock_page)
+        element.count.side_effect = Exception("Query failed")
 
         result = await browser_helper._click_by_text(mock_page, "test-selector", "Target")
         assert result is False
@@ -368,38 +465,30 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_click_more_if_market_hidden_success(self, browser_helper, mock_page):
         """Test successful click more if market hidden."""
-        # Mock more button found and clicked
-        mock_more_element = AsyncMock()
-        mock_more_element.text_content.return_value = "More"
-
-        # Mock dropdown element found and clicked
-        mock_dropdown_element = AsyncMock()
-        mock_dropdown_element.text_content.return_value = "Draw No Bet"
-
-        mock_page.query_selector.side_effect = [mock_more_element, mock_dropdown_element]
+        locator, element = mock_text_locator(mock_page)
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
         assert result is True
+        locator.filter.assert_called_once_with(has_text=MORE_BUTTON_TEXT_PATTERN)
+        assert mock_page.locator.call_args_list[1].args == ("li:has-text('Draw No Bet')",)
+        assert element.click.await_count == 2
+        element.text_content.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_click_more_if_market_hidden_no_more_button(self, browser_helper, mock_page):
         """Test click more if market hidden when no more button is found."""
-        # Mock no more button found
-        mock_page.query_selector.return_value = None
+        _, element = mock_text_locator(mock_page, count=0)
 
         result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
         assert result is False
+        element.click.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_click_more_if_market_hidden_more_button_click_error(self, browser_helper, mock_page):
         """Test click more if market hidden when more button click fails."""
-        # Mock more button found but click fails
-        mock_more_element = AsyncMock()
-        mock_more_element.text_content.return_value = "More"
-        mock_more_element.click.side_effect = Exception("Click failed")
-
-        mock_page.query_selector.return_value = mock_more_element
+        _, element = mock_text_locator(mock_page)
+        element.click.side_effect = Exception("Click failed")
 
         result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
         assert result is False
@@ -407,35 +496,47 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_click_more_if_market_hidden_no_dropdown_match(self, browser_helper, mock_page):
         """Test click more if market hidden when no dropdown match is found."""
-        # Mock more button found and clicked
-        mock_more_element = AsyncMock()
-        mock_more_element.text_content.return_value = "More"
+        dropdown_selectors = OddsPortalSelectors.get_dropdown_selectors_for_market("Draw No Bet")
+        _, element = mock_text_locator(mock_page)
+        element.count.side_effect = [1] + [0] * len(dropdown_selectors)
+        mock_page.wait_for_timeout = AsyncMock()
+        mock_page.eval_on_selector_all.return_value = []  # No debug elements
+        browser_helper.logger.setLevel(logging.INFO)
 
-        # Mock dropdown element found but no text match
-        mock_dropdown_element = AsyncMock()
-        mock_dropdown_element.text_content.return_value = "Different Market"
+        try:
+            result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
+        finally:
+            browser_helper.logger.setLevel(logging.NOTSET)
 
-        mock_page.query_selector.side_effect = [mock_more_element, mock_dropdown_element]
+        assert result is False
+        element.click.assert_awaited_once()
+        mock_page.eval_on_selector_all.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_click_more_if_market_hidden_skips_dropdown_listing_above_info(self, browser_helper, mock_page):
+        """Test that the dropdown content is not read when INFO logs would be discarded."""
+        dropdown_selectors = OddsPortalSelectors.get_dropdown_selectors_for_market("Draw No Bet")
+        _, element = mock_text_locator(mock_page)
+        element.count.side_effect = [1] + [0] * len(dropdown_selectors)
         mock_page.wait_for_timeout = AsyncMock()
-        mock_page.query_selector_all.return_value = []  # No debug elements
+        browser_helper.logger.setLevel(logging.WARNING)
+
+        try:
+            result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
+        finally:
+            browser_helper.logger.setLevel(logging.NOTSET)
 
-        result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
         assert result is False
+        mock_page.eval_on_selector_all.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_click_more_if_market_hidden_dropdown_click_error(self, browser_helper, mock_page):
         """Test click more if market hidden when dropdown click fails."""
-        # Mock more button found and clicked
-        mock_more_element = AsyncMock()
-        mock_more_element.text_content.return_value = "More"
-
-        # Mock dropdown element found but click fails
-        mock_dropdown_element = AsyncMock()
-        mock_dropdown_element.text_content.return_value = "Draw No Bet"
-        mock_dropdown_element.click.side_effect = Exception("Click failed")
-
-        mock_page.query_selector.side_effect = [mock_more_element, mock_dropdown_element]
+        dropdown_selectors = OddsPortalSelectors.get_dropdown_selectors_for_market("Draw No Bet")
+        _, element = mock_text_locator(mock_page)
+        element.click.side_effect = [None] + [Exception("Click failed")] * len(dropdown_selectors)
         mock_page.wait_for_timeout = AsyncMock()
+        mock_page.eval_on_selector_all.return_value = []
 
         result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
         assert result is False
@@ -443,7 +544,7 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_click_more_if_market_hidden_exception(self, browser_helper, mock_page):
         """Test click more if market hidden when exception occurs."""
-        mock_page.query_selector.side_effect = Exception("General error")
+        mock_page.locator.side_effect = Exception("General error")
 
         result = await browser_helper._click_more_if_market_hidden(mock_page, "Draw No Bet")
         assert result is False
@@ -456,22 +557,18 @@ class TestBrowserHelper:
     async def test_verify_tab_is_active_success(self, browser_helper, mock_page):
         """Test successful tab verification."""
         # Mock active element with correct market name
-        mock_element = AsyncMock()
-        mock_element.text_content.return_value = "Draw No Bet"
-        mock_page.query_selector.return_value = mock_element
+        mock_page.evaluate.return_value = [None, "Draw No Bet", None, None]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is True
+        mock_page.evaluate.assert_awaited_once_with(FIRST_MATCH_TEXTS_SCRIPT, list(ACTIVE_TAB_SELECTORS))
 
     @pytest.mark.asyncio
     async def test_verify_tab_is_active_wrong_market(self, browser_helper, mock_page):
         """Test tab verification with wrong market name."""
         # Mock active element with different market name
-        mock_element = AsyncMock()
-        mock_element.text_content = AsyncMock(return_value="1X2")
-        mock_page.query_selector = AsyncMock(return_value=mock_element)
-        # Mock content to return string that doesn't contain the market name
-        mock_page.content = AsyncMock(return_value="some content without the target market")
+        # Mock the page not mentioning the market name either
+        mock_page.evaluate.side_effect = [["1X2", "1X2", None, None], False]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is False
@@ -480,8 +577,7 @@ class TestBrowserHelper:
     async def test_verify_tab_is_active_no_active_element(self, browser_helper, mock_page):
         """Test tab verification when no active element is found."""
         # Mock no active element found
-        mock_page.query_selector.return_value = None
-        mock_page.content = AsyncMock(return_value="<html><body>Some content</body></html>")
+        mock_page.evaluate.side_effect = [[None, None, None, None], False]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is False
@@ -490,19 +586,18 @@ class TestBrowserHelper:
     async def test_verify_tab_is_active_content_fallback(self, browser_helper, mock_page):
         """Test tab verification using content fallback."""
         # Mock no active element but market name in content
-        mock_page.query_selector.return_value = None
-        mock_page.content = AsyncMock(return_value="<html><body>Draw No Bet content</body></html>")
+        mock_page.evaluate.side_effect = [[None, None, None, None], True]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is True
+        mock_page.evaluate.assert_awaited_with(PAGE_MENTIONS_TEXT_SCRIPT, "draw no bet")
+        mock_page.content.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_verify_tab_is_active_exception_handling(self, browser_helper, mock_page):
         """Test tab verification with exception handling."""
         # Mock exception during verification
-        mock_page.query_selector = AsyncMock(side_effect=Exception("Test exception"))
-        # Mock content to return string that doesn't contain the market name
-        mock_page.content = AsyncMock(return_value="some content without the target market")
+        mock_page.evaluate = AsyncMock(side_effect=[Exception("Test exception"), False])
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is False
@@ -511,11 +606,8 @@ class TestBrowserHelper:
     async def test_verify_tab_is_active_empty_text(self, browser_helper, mock_page):
         """Test tab verification with empty text content."""
         # Mock active element with empty text
-        mock_element = AsyncMock()
-        mock_element.text_content = AsyncMock(return_value="")
-        mock_page.query_selector = AsyncMock(return_value=mock_element)
-        # Mock content to return string that doesn't contain the market name
-        mock_page.content = AsyncMock(return_value="some content without the target market")
+        # Mock the page not mentioning the market name either
+        mock_page.evaluate.side_effect = [["", "", None, None], False]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is False
@@ -524,9 +616,7 @@ class TestBrowserHelper:
     async def test_verify_tab_is_active_case_insensitive(self, browser_helper, mock_page):
         """Test tab verification with case insensitive matching."""
         # Mock active element with different case
-        mock_element = AsyncMock()
-        mock_element.text_content = AsyncMock(return_value="DRAW NO BET")
-        mock_page.query_selector.return_value = mock_element
+        mock_page.evaluate.return_value = ["DRAW NO BET", None, None, None]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is True
@@ -535,19 +625,16 @@ class TestBrowserHelper:
     async def test_verify_tab_is_active_partial_match(self, browser_helper, mock_page):
         """Test tab verification with partial text match."""
         # Mock active element with partial match
-        mock_element = AsyncMock()
-        mock_element.text_content = AsyncMock(return_value="Draw No Bet Market")
-        mock_page.query_selector.return_value = mock_element
+        mock_page.evaluate.return_value = ["Draw No Bet Market", None, None, None]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is True
 
     @pytest.mark.asyncio
     async def test_verify_tab_is_active_content_exception(self, browser_helper, mock_page):
-        """Test tab verification when content() fails."""
-        # Mock active element not found and content() fails
-        mock_page.query_selector.return_value = None
-        mock_page.content = AsyncMock(side_effect=Exception("Content failed"))
+        """Test tab verification when the page content check fails."""
+        # Mock active element not found and the page content check fails
+        mock_page.evaluate.side_effect = [[None, None, None, None], Exception("Content failed")]
 
         result = await browser_helper._verify_tab_is_active(mock_page, "Draw No Bet")
         assert result is False
@@ -579,7 +666,7 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_scroll_until_loaded_zero_timeout(self, browser_helper, mock_page):
         """Test scrolling with zero timeout."""
-        mock_page.evaluate.return_value = 1000
+        mock_page.evaluate.return_value = [1000, 0]
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_loaded(mock_page, timeout=0)
@@ -588,7 +675,7 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_scroll_until_loaded_negative_timeout(self, browser_helper, mock_page):
         """Test scrolling with negative timeout."""
-        mock_page.evaluate.return_value = 1000
+        mock_page.evaluate.return_value = [1000, 0]
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_loaded(mock_page, timeout=-1)
@@ -621,7 +708,7 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_click_more_if_market_hidden_empty_market_name(self, browser_helper, mock_page):
         """Test click more if market hidden with empty market name."""
-        mock_page.query_selector = AsyncMock(return_value=None)
+        mock_text_locator(mock_page, count=0)
 
         result = await browser_helper._click_more_if_market_hidden(mock_page, "")
         assert result is False
@@ -629,8 +716,7 @@ class TestBrowserHelper:
     @pytest.mark.asyncio
     async def test_verify_tab_is_active_empty_market_name(self, browser_helper, mock_page):
         """Test verify tab is active with empty market name."""
-        mock_page.query_selector = AsyncMock(return_value=None)
-        mock_page.content = AsyncMock(return_value="some content without empty market name")
+        mock_page.evaluate = AsyncMock(return_value=[None, None, None, None])
 
         result = await browser_helper._verify_tab_is_active(mock_page, "")
         assert result is False
@@ -668,7 +754,7 @@ class TestBrowserHelper:
     async def test_logging_during_scrolling(self, browser_helper, mock_page, caplog):
         """Test logging during scrolling operations."""
         with caplog.at_level(logging.INFO):
-            mock_page.evaluate.return_value = 1000
+            mock_page.evaluate.return_value = [1000, 0]
             mock_page.wait_for_timeout = AsyncMock()
 
             await browser_helper.scroll_until_loaded(mock_page, timeout=0.1)
@@ -696,7 +782,7 @@ class TestBrowserHelper:
     async def test_full_scrolling_flow(self, browser_helper, mock_page):
         """Test the complete scrolling flow."""
         # Mock successful scrolling
-        mock_page.evaluate.return_value = 1000  # Stable height
+        mock_page.evaluate.return_value = [1000, 0]  # Stable height
         mock_page.wait_for_timeout = AsyncMock()
 
         result = await browser_helper.scroll_until_loaded(
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.core.market_extraction.market_grouping import MarketGrouping
+from src.core.sport_market_registry import SportMarketRegistrar
 
 
 class TestMarketGrouping:
@@ -26,6 +27,31 @@ class TestMarketGrouping:
         # Assert
         assert result is None
 
+    def test_get_main_market_info_from_closure(self, market_grouping):
+        """Test extraction of main market info from a registered market lambda."""
+        # Arrange
+        market_method = SportMarketRegistrar.create_market_lambda("1X2", odds_labels=["1", "X", "2"])
+
+        # Act
+        result = market_grouping.get_main_market_info(market_method)
+
+        # Assert
+        assert result == {"main_market": "1X2", "odds_labels": ["1", "X", "2"]}
+
+    def test_get_main_market_info_untagged_function(self, market_grouping):
+        """Test extraction from a plain function that was not created by the registrar."""
+        # Arrange
+        main_market = "1X2"
+
+        def market_method(extractor, page):
+            return extractor.extract_market_odds(page=page, main_market=main_market)
+
+        # Act
+        result = market_grouping.get_main_market_info(market_method)
+
+        # Assert
+        assert result is None
+
     def test_group_markets_by_main_market_empty_markets(self, market_grouping):
         """Test grouping with empty markets list."""
         # Arrange
@@ -38,6 +64,27 @@ class TestMarketGrouping:
         # Assert
         assert result == {}
 
+    def test_group_markets_by_main_market(self, market_grouping):
+        """Test grouping registered markets, skipping unknown and untagged ones."""
+        # Arrange
+        market_methods = {
+            "over_under_2_5": SportMarketRegistrar.create_market_lambda(
+                "Over/Under", "Over/Under +2.5", ["odds_over", "odds_under"]
+            ),
+            "1x2": SportMarketRegistrar.create_market_lambda("1X2", odds_labels=["1", "X", "2"]),
+            "over_under_1_5": SportMarketRegistrar.create_market_lambda(
+                "Over/Under", "Over/Under +1.5", ["odds_over", "odds_under"]
+            ),
+            "untagged": MagicMock(),
+        }
+        markets = ["over_under_2_5", "unknown", "1x2", "untagged", "over_under_1_5"]
+
+        # Act
+        result = market_grouping.group_markets_by_main_market(markets, market_methods)
+
+        # Assert
+        assert result == {"Over/Under": ["over_under_2_5", "over_under_1_5"], "1X2": ["1x2"]}
+
     def test_logger_initialization(self, market_grouping):
         """Test that logger is properly initialized."""
         assert market_grouping.logger is not None
@@ -1,9 +1,10 @@
 from unittest.mock import AsyncMock, MagicMock
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 
 from src.core.browser_helper import BrowserHelper
-from src.core.market_extraction.navigation_manager import NavigationManager
+from src.core.market_extraction.navigation_manager import ACTIVE_MARKET_TAB_SCRIPT, NavigationManager
 
 
 class TestNavigationManager:
@@ -60,38 +61,35 @@ class TestNavigationManager:
         """Test successful market switch wait."""
         # Arrange
         market_name = "Over/Under"
-        mock_active_tab = AsyncMock()
-        mock_active_tab.text_content = AsyncMock(return_value="Over/Under")
-        page_mock.query_selector = AsyncMock(return_value=mock_active_tab)
 
         # Act
         result = await navigation_manager.wait_for_market_switch(page_mock, market_name)
 
         # Assert
         assert result is True
-        page_mock.wait_for_timeout.assert_called_with(NavigationManager.MARKET_SWITCH_WAIT_TIME)
+        page_mock.wait_for_function.assert_awaited_once_with(
+            ACTIVE_MARKET_TAB_SCRIPT,
+            arg="over/under",
+            timeout=NavigationManager.MARKET_SWITCH_WAIT_TIME * 3,
+            polling=NavigationManager.MARKET_SWITCH_POLLING_INTERVAL,
+        )
+        page_mock.wait_for_timeout.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_wait_for_market_switch_wrong_market(self, navigation_manager, page_mock):
-        """Test market switch wait with wrong market name."""
-        # Arrange
-        market_name = "Over/Under"
-        mock_active_tab = AsyncMock()
-        mock_active_tab.text_content = AsyncMock(return_value="1X2")
-        page_mock.query_selector = AsyncMock(return_value=mock_active_tab)
-
+    async def test_wait_for_market_switch_custom_attempts(self, navigation_manager, page_mock):
+        """Test that max_attempts bounds the market switch wait."""
         # Act
-        result = await navigation_manager.wait_for_market_switch(page_mock, market_name)
+        await navigation_manager.wait_for_market_switch(page_mock, "1X2", max_attempts=1)
 
         # Assert
-        assert result is False
+        assert page_mock.wait_for_function.await_args.kwargs["timeout"] == NavigationManager.MARKET_SWITCH_WAIT_TIME
 
     @pytest.mark.asyncio
-    async def test_wait_for_market_switch_no_active_tab(self, navigation_manager, page_mock):
-        """Test market switch wait when no active tab is found."""
+    async def test_wait_for_market_switch_timeout(self, navigation_manager, page_mock):
+        """Test market switch wait when the market never becomes active."""
         # Arrange
         market_name = "Over/Under"
-        page_mock.query_selector = AsyncMock(return_value=None)
+        page_mock.wait_for_function = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
 
         # Act
         result = await navigation_manager.wait_for_market_switch(page_mock, market_name)
@@ -104,7 +102,7 @@ class TestNavigationManager:
         """Test market switch wait with exception handling."""
         # Arrange
         market_name = "Over/Under"
-        page_mock.query_selector = AsyncMock(side_effect=Exception("Test exception"))
+        page_mock.wait_for_function = AsyncMock(side_effect=Exception("Test exception"))
 
         # Act
         result = await navigation_manager.wait_for_market_switch(page_mock, market_name)
@@ -188,3 +186,4 @@ class TestNavigationManager:
         assert NavigationManager.DEFAULT_TIMEOUT == 5000
         assert NavigationManager.SCROLL_PAUSE_TIME == 2000
         assert NavigationManager.MARKET_SWITCH_WAIT_TIME == 3000
+        assert NavigationManager.MARKET_SWITCH_POLLING_INTERVAL == 100
@@ -1,8 +1,17 @@
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 
-from src.core.market_extraction.odds_history_extractor import OddsHistoryExtractor
+from src.core.market_extraction.odds_history_extractor import (
+    BOOKMAKER_ROW_SELECTOR,
+    MATCHING_BOOKMAKER_ROWS_SCRIPT,
+    MODAL_HTML_SCRIPT,
+    MODAL_REPLACED_SCRIPT,
+    ODDS_BLOCK_SELECTOR,
+    ODDS_MOVEMENT_SELECTOR,
+    OddsHistoryExtractor,
+)
 
 
 class TestOddsHistoryExtractor:
@@ -29,26 +38,18 @@ class TestOddsHistoryExtractor:
 
         # Create mock for bookmaker row
         bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value=bookmaker_name)
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
 
         # Create mock for odds blocks
         odds_block = AsyncMock()
         bookmaker_row.query_selector_all = AsyncMock(return_value=[odds_block])
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
         page_mock.wait_for_selector = AsyncMock()
 
-        # Create mock for modal wrapper and element
-        modal_wrapper = AsyncMock()
-        modal_element = AsyncMock()
-        modal_element.inner_html = AsyncMock(return_value=sample_html)
-        modal_wrapper.as_element = MagicMock(return_value=modal_element)
-
-        # Set up the chain of mocks
-        page_mock.wait_for_selector.return_value.evaluate_handle.return_value = modal_wrapper
+        # Set up the modal HTML read from the odds movement heading
+        page_mock.wait_for_selector.return_value.evaluate.return_value = sample_html
 
         # Act
         result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -56,7 +57,13 @@ class TestOddsHistoryExtractor:
         # Assert
         assert len(result) == 1
         assert result[0] == sample_html
-        page_mock.wait_for_timeout.assert_called_with(2000)  # SCROLL_PAUSE_TIME
+        page_mock.query_selector_all.assert_awaited_once_with(BOOKMAKER_ROW_SELECTOR)
+        page_mock.evaluate.assert_awaited_once_with(MATCHING_BOOKMAKER_ROWS_SCRIPT, [[bookmaker_row], "bookmaker1"])
+        page_mock.wait_for_selector.assert_any_await(BOOKMAKER_ROW_SELECTOR, timeout=5000)
+        page_mock.wait_for_selector.assert_awaited_with(ODDS_MOVEMENT_SELECTOR, timeout=3000)
+        page_mock.wait_for_timeout.assert_not_called()
+        page_mock.wait_for_selector.return_value.evaluate.assert_awaited_once_with(MODAL_HTML_SCRIPT)
+        page_mock.wait_for_selector.return_value.evaluate_handle.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_extract_odds_history_for_bookmaker_no_match(self, odds_history_extractor, page_mock):
@@ -64,39 +71,30 @@ class TestOddsHistoryExtractor:
         # Arrange
         bookmaker_name = "NonExistentBookmaker"
 
-        # Create mock for bookmaker row
+        # Create mock for page: no row title contains the bookmaker name
         bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value="DifferentBookmaker")
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
-
-        # Create mock for page
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
+        page_mock.evaluate = AsyncMock(return_value=[])
 
         # Act
         result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
 
         # Assert
         assert result == []
+        bookmaker_row.query_selector_all.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_extract_odds_history_for_bookmaker_no_logo(self, odds_history_extractor, page_mock):
-        """Test extraction when bookmaker row has no logo."""
+    async def test_extract_odds_history_for_bookmaker_no_rows(self, odds_history_extractor, page_mock):
+        """Test extraction when the rows are gone by the time their handles are fetched."""
         # Arrange
-        bookmaker_name = "Bookmaker1"
-
-        # Create mock for bookmaker row without logo
-        bookmaker_row = AsyncMock()
-        bookmaker_row.query_selector = AsyncMock(return_value=None)
-
-        # Create mock for page
-        page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
+        page_mock.query_selector_all = AsyncMock(return_value=[])
 
         # Act
-        result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
+        result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, "Bookmaker1")
 
         # Assert
         assert result == []
+        page_mock.evaluate.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_extract_odds_history_for_bookmaker_no_odds_blocks(self, odds_history_extractor, page_mock):
@@ -106,14 +104,12 @@ class TestOddsHistoryExtractor:
 
         # Create mock for bookmaker row
         bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value=bookmaker_name)
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
 
         # Create mock for odds blocks (empty)
         bookmaker_row.query_selector_all = AsyncMock(return_value=[])
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
 
         # Act
@@ -130,17 +126,15 @@ class TestOddsHistoryExtractor:
 
         # Create mock for bookmaker row
         bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value=bookmaker_name)
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
 
         # Create mock for odds blocks
         odds_block = AsyncMock()
         bookmaker_row.query_selector_all = AsyncMock(return_value=[odds_block])
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
-        page_mock.wait_for_selector = AsyncMock(side_effect=Exception("Modal not found"))
+        page_mock.wait_for_selector = AsyncMock(side_effect=[None, Exception("Modal not found")])
 
         # Act
         result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -156,24 +150,18 @@ class TestOddsHistoryExtractor:
 
         # Create mock for bookmaker row
         bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value=bookmaker_name)
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
 
         # Create mock for odds blocks
         odds_block = AsyncMock()
         bookmaker_row.query_selector_all = AsyncMock(return_value=[odds_block])
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
         page_mock.wait_for_selector = AsyncMock()
 
-        # Create mock for modal wrapper that returns None
-        modal_wrapper = AsyncMock()
-        modal_wrapper.as_element = MagicMock(return_value=None)
-
-        # Set up the chain of mocks
-        page_mock.wait_for_selector.return_value.evaluate_handle.return_value = modal_wrapper
+        # The odds movement heading has no parent element
+        page_mock.wait_for_selector.return_value.evaluate.return_value = None
 
         # Act
         result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -191,9 +179,6 @@ class TestOddsHistoryExtractor:
 
         # Create mock for bookmaker row
         bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value=bookmaker_name)
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
 
         # Create mock for multiple odds blocks
         odds_block1 = AsyncMock()
@@ -201,22 +186,12 @@ class TestOddsHistoryExtractor:
         bookmaker_row.query_selector_all = AsyncMock(return_value=[odds_block1, odds_block2])
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
         page_mock.wait_for_selector = AsyncMock()
 
-        # Create mock for modal wrapper and elements
-        modal_wrapper1 = AsyncMock()
-        modal_element1 = AsyncMock()
-        modal_element1.inner_html = AsyncMock(return_value=sample_html1)
-        modal_wrapper1.as_element = MagicMock(return_value=modal_element1)
-
-        modal_wrapper2 = AsyncMock()
-        modal_element2 = AsyncMock()
-        modal_element2.inner_html = AsyncMock(return_value=sample_html2)
-        modal_wrapper2.as_element = MagicMock(return_value=modal_element2)
-
-        # Set up the chain of mocks
-        page_mock.wait_for_selector.return_value.evaluate_handle.side_effect = [modal_wrapper1, modal_wrapper2]
+        # Set up the modal HTML read for each hovered odds block
+        page_mock.wait_for_selector.return_value.evaluate.side_effect = [sample_html1, sample_html2]
 
         # Act
         result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -225,6 +200,34 @@ class TestOddsHistoryExtractor:
         assert len(result) == 2
         assert result[0] == sample_html1
         assert result[1] == sample_html2
+        # The first modal must make way before the second one is read
+        page_mock.wait_for_function.assert_awaited_once_with(
+            MODAL_REPLACED_SCRIPT, arg=[page_mock.wait_for_selector.return_value, sample_html1], timeout=3000
+        )
+
+    @pytest.mark.asyncio
+    async def test_extract_odds_history_for_bookmaker_unchanged_modal_still_read(
+        self, odds_history_extractor, page_mock
+    ):
+        """Test that a modal that stays the same for the next odds block is still recorded for it."""
+        # Arrange
+        bookmaker_name = "Bookmaker1"
+        sample_html = "<div>Same modal HTML</div>"
+
+        bookmaker_row = AsyncMock()
+        bookmaker_row.query_selector_all = AsyncMock(return_value=[AsyncMock(), AsyncMock()])
+
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
+        page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
+        page_mock.wait_for_selector = AsyncMock()
+        page_mock.wait_for_selector.return_value.evaluate.return_value = sample_html
+        page_mock.wait_for_function = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+
+        # Act
+        result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
+
+        # Assert
+        assert result == [sample_html, sample_html]
 
     @pytest.mark.asyncio
     async def test_extract_odds_history_for_bookmaker_multiple_bookmakers(self, odds_history_extractor, page_mock):
@@ -235,32 +238,21 @@ class TestOddsHistoryExtractor:
 
         # Create mock for first bookmaker row (no match)
         bookmaker_row1 = AsyncMock()
-        logo_img1 = AsyncMock()
-        logo_img1.get_attribute = AsyncMock(return_value="DifferentBookmaker")
-        bookmaker_row1.query_selector = AsyncMock(return_value=logo_img1)
 
         # Create mock for second bookmaker row (match)
         bookmaker_row2 = AsyncMock()
-        logo_img2 = AsyncMock()
-        logo_img2.get_attribute = AsyncMock(return_value=bookmaker_name)
-        bookmaker_row2.query_selector = AsyncMock(return_value=logo_img2)
 
         # Create mock for odds blocks
         odds_block = AsyncMock()
         bookmaker_row2.query_selector_all = AsyncMock(return_value=[odds_block])
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[1, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row1, bookmaker_row2])
         page_mock.wait_for_selector = AsyncMock()
 
-        # Create mock for modal wrapper and element
-        modal_wrapper = AsyncMock()
-        modal_element = AsyncMock()
-        modal_element.inner_html = AsyncMock(return_value=sample_html)
-        modal_wrapper.as_element = MagicMock(return_value=modal_element)
-
-        # Set up the chain of mocks
-        page_mock.wait_for_selector.return_value.evaluate_handle.return_value = modal_wrapper
+        # Set up the modal HTML read from the odds movement heading
+        page_mock.wait_for_selector.return_value.evaluate.return_value = sample_html
 
         # Act
         result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -268,6 +260,55 @@ class TestOddsHistoryExtractor:
         # Assert
         assert len(result) == 1
         assert result[0] == sample_html
+        bookmaker_row1.query_selector_all.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_extract_odds_history_for_bookmaker_multiple_matching_rows(self, odds_history_extractor, page_mock):
+        """Test that every matching row is processed, in page order, even when one of them fails."""
+        # Arrange
+        bookmaker_name = "Bookmaker1"
+
+        # Create mocks for three matching rows, the second of which fails
+        bookmaker_row1 = AsyncMock()
+        bookmaker_row1.query_selector_all = AsyncMock(return_value=[AsyncMock()])
+        bookmaker_row2 = AsyncMock()
+        bookmaker_row2.query_selector_all = AsyncMock(side_effect=Exception("Row processing error"))
+        bookmaker_row3 = AsyncMock()
+        bookmaker_row3.query_selector_all = AsyncMock(return_value=[AsyncMock()])
+
+        # Create mock for page
+        page_mock.evaluate = AsyncMock(
+            return_value=[[0, bookmaker_name], [1, bookmaker_name], [2, f"{bookmaker_name} Exchange"]]
+        )
+        page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row1, bookmaker_row2, bookmaker_row3])
+        page_mock.wait_for_selector = AsyncMock()
+
+        # Set up the modal HTML read for each hovered odds block
+        page_mock.wait_for_selector.return_value.evaluate.side_effect = [
+            "<div>Modal HTML 1</div>",
+            "<div>Modal HTML 3</div>",
+        ]
+
+        # Act
+        result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
+
+        # Assert
+        assert result == ["<div>Modal HTML 1</div>", "<div>Modal HTML 3</div>"]
+        for row in (bookmaker_row1, bookmaker_row2, bookmaker_row3):
+            row.query_selector_all.assert_awaited_once_with(ODDS_BLOCK_SELECTOR)
+
+    @pytest.mark.asyncio
+    async def test_extract_odds_history_for_bookmaker_rows_not_loaded(self, odds_history_extractor, page_mock):
+        """Test extraction when the bookmaker rows never appear."""
+        # Arrange
+        page_mock.wait_for_selector = AsyncMock(side_effect=Exception("Timeout"))
+
+        # Act
+        result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, "Bookmaker1")
+
+        # Assert
+        assert result == []
+        page_mock.query_selector_all.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_extract_odds_history_for_bookmaker_exception_handling(self, odds_history_extractor, page_mock):
@@ -276,7 +317,7 @@ class TestOddsHistoryExtractor:
         bookmaker_name = "Bookmaker1"
 
         # Create mock that raises an exception
-        page_mock.query_selector_all = AsyncMock(side_effect=Exception("Test exception"))
+        page_mock.evaluate = AsyncMock(side_effect=Exception("Test exception"))
 
         # Act
         result = await odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -292,9 +333,10 @@ class TestOddsHistoryExtractor:
 
         # Create mock for bookmaker row that raises exception
         bookmaker_row = AsyncMock()
-        bookmaker_row.query_selector = AsyncMock(side_effect=Exception("Row processing error"))
+        bookmaker_row.query_selector_all = AsyncMock(side_effect=Exception("Row processing error"))
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
 
         # Act
@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.core.market_extraction.odds_parser import OddsParser
+from src.core.market_extraction.odds_parser import OddsParser, _collapse_duplicated_odds, _parse_modal_timestamp
 
 
 class TestOddsParser:
@@ -86,6 +86,28 @@ class TestOddsParser:
         assert result[0]["X"] == "3.50"
         assert result[0]["2"] == "4.20"
 
+    def test_parse_market_odds_with_target_bookmaker_selects_only_its_rows(self, odds_parser):
+        """Test that the target bookmaker is matched case-insensitively, including non-ASCII letters."""
+        # Arrange
+        html = """
+        <div class="border-black-borders flex h-9">
+            <img class="bookmaker-logo" title="ÉLITEBET">
+            <div class="flex-center flex-col font-bold">1.90</div>
+        </div>
+        <div class="border-black-borders flex h-9">
+            <img class="bookmaker-logo" title="Bookmaker2">
+            <div class="flex-center flex-col font-bold">1.85</div>
+        </div>
+        """
+
+        # Act
+        result = odds_parser.parse_market_odds(html, "FullTime", ["1"], "élitebet")
+        missing = odds_parser.parse_market_odds(html, "FullTime", ["1"], "Bookmaker3")
+
+        # Assert
+        assert result == [{"1": "1.90", "bookmaker_name": "ÉLITEBET", "period": "FullTime"}]
+        assert missing == []
+
     def test_parse_market_odds_no_bookmakers(self, odds_parser):
         """Test parsing odds when no bookmakers are found."""
         # Arrange
@@ -145,6 +167,22 @@ class TestOddsParser:
         assert len(result) == 1
         assert result[0]["1"] == "1.90"  # Duplicate should be removed
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1.901.90", "1.90"),
+            ("11.5011.50", "11.50"),
+            ("1.90", "1.90"),
+            ("+150+150", "+150+150"),
+            ("5/45/4", "5/45/4"),
+            ("-", "-"),
+            ("", ""),
+        ],
+    )
+    def test_collapse_duplicated_odds(self, value, expected):
+        """Test that only decimal odds rendered twice are collapsed."""
+        assert _collapse_duplicated_odds(value) == expected
+
     def test_parse_market_odds_fallback_selector(self, odds_parser):
         """Test parsing with fallback selector when primary selector fails."""
         # Arrange
@@ -164,6 +202,46 @@ class TestOddsParser:
         assert len(result) == 1
         assert result[0]["bookmaker_name"] == "Bookmaker1"
 
+    def test_parse_market_odds_ignores_content_outside_bookmaker_rows(self, odds_parser):
+        """Test that rows nested in the page layout are found and unrelated markup is skipped."""
+        # Arrange
+        full_page_html = f"""
+        <html><body>
+            <header><div class="flex-center flex-col font-bold">9.99</div></header>
+            <main><section>{self.SAMPLE_HTML_ODDS}</section></main>
+        </body></html>
+        """
+        odds_labels = ["1", "X", "2"]
+
+        # Act
+        result = odds_parser.parse_market_odds(full_page_html, "FullTime", odds_labels)
+
+        # Assert
+        assert [row["bookmaker_name"] for row in result] == ["Bookmaker1", "Bookmaker2"]
+        assert result[1]["2"] == "4.10"
+
+    def test_parse_market_odds_matches_class_tokens_in_any_order(self, odds_parser):
+        """Test that rows and odds blocks are matched on their class tokens, whatever their order."""
+        # Arrange
+        html = """
+        <div class="flex h-9 border-black-borders">
+            <img class="bookmaker-logo" title="Bookmaker1">
+            <div class="font-bold flex-center flex-col">1.90</div>
+            <div class="flex-col flex-center font-bold">3.50</div>
+        </div>
+        <div class="hover:border-black-borders">
+            <img class="bookmaker-logo" title="NotARow">
+            <div class="flex-center flex-col font-bold">9.99</div>
+            <div class="flex-center flex-col font-bold">9.99</div>
+        </div>
+        """
+
+        # Act
+        result = odds_parser.parse_market_odds(html, "FullTime", ["1", "X"])
+
+        # Assert
+        assert result == [{"1": "1.90", "X": "3.50", "bookmaker_name": "Bookmaker1", "period": "FullTime"}]
+
     def test_parse_odds_history_modal_success(self, odds_parser):
         """Test successful parsing of odds history modal."""
         # Arrange
@@ -172,7 +250,7 @@ class TestOddsParser:
             mock_now = MagicMock()
             mock_now.year = 2025
             mock_datetime.now.return_value = mock_now
-            mock_datetime.strptime.side_effect = lambda *args, **kwargs: datetime.strptime(*args, **kwargs)
+            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
 
             # Act
             result = odds_parser.parse_odds_history_modal(self.SAMPLE_HTML_ODDS_HISTORY)
@@ -185,7 +263,29 @@ class TestOddsParser:
             assert "opening_odds" in result
             # Verify that timestamps include the mocked year (2025)
             assert "2025" in result["odds_history"][0]["timestamp"]
-            assert "2025" in result["odds_history"][1]["timestamp"]
+            assert result["odds_history"][0]["timestamp"] == "2025-06-10T14:30:00"
+            assert result["odds_history"][1]["timestamp"] == "2025-06-10T12:00:00"
+            assert result["opening_odds"]["timestamp"].startswith("2025")
+            mock_datetime.now.assert_called_once()
+
+    def test_parse_odds_history_modal_parses_repeated_timestamps_once(self, odds_parser):
+        """Test that a timestamp shared by several entries of a modal is parsed only once."""
+        # Arrange
+        modal_html = self.SAMPLE_HTML_ODDS_HISTORY.replace("10 Jun, 12:00", "10 Jun, 14:30").replace(
+            "10 Jun, 08:00", "10 Jun, 14:30"
+        )
+
+        with patch(
+            "src.core.market_extraction.odds_parser._parse_modal_timestamp", wraps=_parse_modal_timestamp
+        ) as mock_parse:
+            # Act
+            result = odds_parser.parse_odds_history_modal(modal_html)
+
+        # Assert
+        timestamps = [entry["timestamp"] for entry in result["odds_history"]]
+        assert timestamps == [timestamps[0]] * 2
+        assert result["opening_odds"]["timestamp"] == timestamps[0]
+        mock_parse.assert_called_once()
 
     def test_parse_odds_history_modal_invalid_html(self, odds_parser):
         """Test parsing odds history from invalid HTML."""
@@ -194,9 +294,7 @@ class TestOddsParser:
             mock_now = MagicMock()
             mock_now.year = 2025
             mock_datetime.now.return_value = mock_now
-            mock_datetime.strptime.side_effect = lambda *args, **kwargs: __import__("datetime").datetime.strptime(
-                *args, **kwargs
-            )
+            mock_datetime.side_effect = lambda *args, **kwargs: __import__("datetime").datetime(*args, **kwargs)
 
             # Act
             invalid_html = "<div>Invalid HTML content</div>"
@@ -208,19 +306,19 @@ class TestOddsParser:
     def test_parse_odds_history_modal_invalid_date(self, odds_parser):
         """Test parsing odds history with invalid date format."""
         # Arrange
-        with patch("src.core.market_extraction.odds_parser.datetime") as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.year = 2025
-            mock_datetime.now.return_value = mock_now
-            # Force ValueError on strptime
-            mock_datetime.strptime.side_effect = ValueError("Invalid date format")
+        modal_html = (
+            self.SAMPLE_HTML_ODDS_HISTORY.replace("10 Jun, 14:30", "10 Foo, 14:30")
+            .replace("10 Jun, 12:00", "32 Jun, 12:00")
+            .replace("10 Jun, 08:00", "10 Jun 08:00")
+        )
 
-            # Act
-            result = odds_parser.parse_odds_history_modal(self.SAMPLE_HTML_ODDS_HISTORY)
+        # Act
+        result = odds_parser.parse_odds_history_modal(modal_html)
 
-            # Assert
-            assert "odds_history" in result
-            assert len(result["odds_history"]) == 0
+        # Assert
+        assert "odds_history" in result
+        assert len(result["odds_history"]) == 0
+        assert result["opening_odds"] is None
 
     def test_logger_initialization(self, odds_parser):
         """Test that logger is properly initialized."""
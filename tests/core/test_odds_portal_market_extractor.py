@@ -155,7 +155,7 @@ class TestOddsPortalMarketExtractor:
             mock_now = MagicMock()
             mock_now.year = 2025
             mock_datetime.now.return_value = mock_now
-            mock_datetime.strptime.side_effect = lambda *args, **kwargs: datetime.strptime(*args, **kwargs)
+            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
 
             # Act
             result = extractor.odds_parser.parse_odds_history_modal(SAMPLE_HTML_ODDS_HISTORY)
@@ -177,7 +177,7 @@ class TestOddsPortalMarketExtractor:
             mock_now = MagicMock()
             mock_now.year = 2025
             mock_datetime.now.return_value = mock_now
-            mock_datetime.strptime.side_effect = lambda *args, **kwargs: datetime.strptime(*args, **kwargs)
+            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
 
             # Act
             invalid_html = "<div>Invalid HTML content</div>"
@@ -193,8 +193,8 @@ class TestOddsPortalMarketExtractor:
             mock_now = MagicMock()
             mock_now.year = 2025
             mock_datetime.now.return_value = mock_now
-            # Force ValueError on strptime
-            mock_datetime.strptime.side_effect = ValueError("Invalid date format")
+            # Force ValueError when building the timestamp
+            mock_datetime.side_effect = ValueError("Invalid date format")
 
             # Act
             result = extractor.odds_parser.parse_odds_history_modal(SAMPLE_HTML_ODDS_HISTORY)
@@ -356,26 +356,18 @@ class TestOddsPortalMarketExtractor:
 
         # Create mock for bookmaker row
         bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value=bookmaker_name)
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
 
         # Create mock for odds blocks
         odds_block = AsyncMock()
         bookmaker_row.query_selector_all = AsyncMock(return_value=[odds_block])
 
         # Create mock for page
+        page_mock.evaluate = AsyncMock(return_value=[[0, bookmaker_name]])
         page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
         page_mock.wait_for_selector = AsyncMock()
 
-        # Create mock for modal wrapper and element
-        modal_wrapper = AsyncMock()
-        modal_element = AsyncMock()
-        modal_element.inner_html = AsyncMock(return_value=SAMPLE_HTML_ODDS_HISTORY)
-        modal_wrapper.as_element = MagicMock(return_value=modal_element)
-
-        # Set up the chain of mocks
-        page_mock.wait_for_selector.return_value.evaluate_handle.return_value = modal_wrapper
+        # Set up the modal HTML read from the odds movement heading
+        page_mock.wait_for_selector.return_value.evaluate.return_value = SAMPLE_HTML_ODDS_HISTORY
 
         # Act
         result = await extractor.odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -390,14 +382,8 @@ class TestOddsPortalMarketExtractor:
         # Arrange
         bookmaker_name = "NonExistentBookmaker"
 
-        # Create mock for bookmaker row
-        bookmaker_row = AsyncMock()
-        logo_img = AsyncMock()
-        logo_img.get_attribute = AsyncMock(return_value="DifferentBookmaker")
-        bookmaker_row.query_selector = AsyncMock(return_value=logo_img)
-
-        # Create mock for page
-        page_mock.query_selector_all = AsyncMock(return_value=[bookmaker_row])
+        # Create mock for page: no bookmaker row matches
+        page_mock.evaluate = AsyncMock(return_value=[])
 
         # Act
         result = await extractor.odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -412,7 +398,7 @@ class TestOddsPortalMarketExtractor:
         bookmaker_name = "Bookmaker1"
 
         # Create mock that raises an exception
-        page_mock.query_selector_all = AsyncMock(side_effect=Exception("Test exception"))
+        page_mock.evaluate = AsyncMock(side_effect=Exception("Test exception"))
 
         # Act - This method handles exceptions internally
         result = await extractor.odds_history_extractor.extract_odds_history_for_bookmaker(page_mock, bookmaker_name)
@@ -99,6 +99,8 @@ class TestSportMarketRegistrar:
             target_bookmaker=None,
             preview_submarkets_only=False,
         )
+        assert lambda_func.main_market == main_market
+        assert lambda_func.odds_labels == odds_labels
 
     def test_register_football_markets(self):
         """Test registering markets for football."""
@@ -1,8 +1,15 @@
 from unittest.mock import AsyncMock
 
+from bs4 import BeautifulSoup
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 
-from src.core.market_extraction.submarket_extractor import SubmarketExtractor
+from src.core.market_extraction.submarket_extractor import (
+    SUBMARKET_ROW_SELECTOR,
+    SUBMARKET_ROWS_WAIT_TIMEOUT,
+    SubmarketExtractor,
+    _collapsed_option_box_pattern,
+)
 
 
 class TestSubmarketExtractor:
@@ -33,6 +40,35 @@ class TestSubmarketExtractor:
         # Assert
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_is_preview_compatible_market_with_visible_odds(self, submarket_extractor, page_mock):
+        """Test that a market with several submarkets, one of them showing odds, is preview compatible."""
+        # Arrange
+        row_with_odds = (
+            '<div class="border-black-borders"><p data-testid="odd-container-default">1.90</p>'
+            '<p data-testid="odd-container-default">1.95</p></div>'
+        )
+        page_mock.content = AsyncMock(return_value=f'{row_with_odds}<div class="border-black-borders"></div>')
+
+        # Act
+        result = await submarket_extractor.is_preview_compatible_market(page_mock, "Over/Under")
+
+        # Assert
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_is_preview_compatible_market_without_visible_odds(self, submarket_extractor, page_mock):
+        """Test that a market whose submarkets show fewer than 2 odds each is not preview compatible."""
+        # Arrange
+        row = '<div class="border-black-borders"><p data-testid="odd-container-default">1.90</p></div>'
+        page_mock.content = AsyncMock(return_value=row * 3)
+
+        # Act
+        result = await submarket_extractor.is_preview_compatible_market(page_mock, "Over/Under")
+
+        # Assert
+        assert result is False
+
     @pytest.mark.asyncio
     async def test_is_preview_compatible_market_exception_handling(self, submarket_extractor, page_mock):
         """Test exception handling during preview compatibility check."""
@@ -126,6 +162,44 @@ class TestSubmarketExtractor:
         # Assert
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_extract_visible_submarkets_passive_default_labels(self, submarket_extractor, page_mock):
+        """Test that default labels follow the market type and rows without enough non-empty odds are skipped."""
+        # Arrange
+        def row(name, *odds):
+            cells = "".join(f'<p data-testid="odd-container-default">{odd}</p>' for odd in odds)
+            return f'<div class="border-black-borders"><p class="font-bold">{name}</p>{cells}</div>'
+
+        page_mock.content = AsyncMock(return_value=row("1:0", "7.50") + row("2:0", "") + row("2:1", "9.00", "1.50"))
+
+        # Act
+        result = await submarket_extractor.extract_visible_submarkets_passive(page_mock, "Correct Score", "FullTime")
+
+        # Assert
+        assert [(entry["submarket_name"], entry["correct_score"]) for entry in result] == [
+            ("1:0", "7.50"),
+            ("2:1", "9.00"),
+        ]
+        assert result[1]["odds_option_2"] == "1.50"
+
+    @pytest.mark.asyncio
+    async def test_extract_visible_submarkets_passive_waits_for_rows(self, submarket_extractor, page_mock):
+        """Test that the page is read once rows are rendered, or as is when they never show up."""
+        # Arrange
+        page_mock.wait_for_selector = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout"))
+        page_mock.content = AsyncMock(return_value="<div>No submarkets</div>")
+
+        # Act
+        result = await submarket_extractor.extract_visible_submarkets_passive(page_mock, "Over/Under", "FullTime")
+
+        # Assert
+        assert result == []
+        page_mock.wait_for_selector.assert_awaited_once_with(
+            SUBMARKET_ROW_SELECTOR, state="attached", timeout=SUBMARKET_ROWS_WAIT_TIMEOUT
+        )
+        page_mock.content.assert_awaited_once()
+        page_mock.wait_for_timeout.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_extract_visible_submarkets_passive_exception_handling(self, submarket_extractor, page_mock):
         """Test exception handling during submarket extraction."""
@@ -170,6 +244,25 @@ class TestSubmarketExtractor:
         # Assert
         assert result == []
 
+    def test_extract_submarket_name_from_collapsed_option_box(self, submarket_extractor):
+        """Test that the submarket name is read from the market's collapsed option box."""
+        row = BeautifulSoup(
+            '<div class="border-black-borders"><div data-testid="over-under-collapsed-option-box">'
+            '<p class="max-sm:!hidden">Over/Under +2.5</p></div></div>',
+            "html.parser",
+        ).div
+
+        assert submarket_extractor._extract_submarket_name(row, "Over/Under") == "Over/Under +2.5"
+        assert _collapsed_option_box_pattern("Over/Under") is _collapsed_option_box_pattern("Over/Under")
+
+    def test_extract_submarket_name_falls_back_to_score_text(self, submarket_extractor):
+        """Test that the last-resort scan skips odds and percentages and returns the first score-like text."""
+        row = BeautifulSoup(
+            '<div class="border-black-borders"><p>2.80</p><p>1:50%</p><p>:</p><p>2:1</p><p>3:0</p></div>', "lxml"
+        ).div
+
+        assert submarket_extractor._extract_submarket_name(row, "Correct Score") == "2:1"
+
     def test_logger_initialization(self, submarket_extractor):
         """Test that logger is properly initialized."""
         assert submarket_extractor.logger is not None